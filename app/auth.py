@@ -2,6 +2,7 @@
 Authentication and authorization helpers
 """
 
+import functools
 import hmac
 import re
 import secrets
@@ -28,6 +29,17 @@ def validate_pid_format(pid: str) -> bool:
     return bool(PID_PATTERN.match(pid))
 
 
+# Cookie Signing
+
+
+# Signers are stateless, so one per secret key can be shared across requests.
+# The signed cookies themselves are not cached: each embeds its own timestamp.
+@functools.lru_cache(maxsize=8)
+def _get_signer(secret_key: str) -> TimestampSigner:
+    """Return a (cached) timestamp signer for a secret key"""
+    return TimestampSigner(secret_key)
+
+
 # PID Cookie Management
 
 
@@ -45,7 +57,7 @@ def create_pid_cookie(
     Returns:
         Signed cookie string
     """
-    signer = TimestampSigner(secret_key)
+    signer = _get_signer(secret_key)
     return signer.sign(pid).decode()
 
 
@@ -69,7 +81,7 @@ def verify_pid_cookie(
         return None
 
     try:
-        signer = TimestampSigner(secret_key)
+        signer = _get_signer(secret_key)
         # If max_age is provided, check expiration
         if max_age is not None:
             pid = signer.unsign(cookie, max_age=max_age).decode()
@@ -102,7 +114,7 @@ def create_admin_cookie(
     Returns:
         Signed cookie string
     """
-    signer = TimestampSigner(secret_key)
+    signer = _get_signer(secret_key)
     # Combine course slug and secret for verification
     data = f"{course}:{course_secret}"
     return signer.sign(data).decode()
@@ -130,7 +142,7 @@ def verify_admin_cookie(
         return False
 
     try:
-        signer = TimestampSigner(settings.secret_key)
+        signer = _get_signer(settings.secret_key)
 
         # Unsign the cookie
         if max_age is not None:
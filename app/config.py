@@ -3,20 +3,42 @@ Configuration management for the application
 """
 
 import tomllib
+from dataclasses import dataclass
+from io import BufferedIOBase
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the Rust-backed rtoml parser when installed; fall back to stdlib tomllib
+try:
+    import rtoml
 
+    TOMLDecodeError: type[Exception] = rtoml.TomlParsingError
+
+    def _load_toml(f: BufferedIOBase) -> dict[str, Any]:
+        return cast(dict[str, Any], rtoml.loads(f.read().decode("utf-8")))
+
+except ImportError:
+    TOMLDecodeError = tomllib.TOMLDecodeError
+
+    def _load_toml(f: BufferedIOBase) -> dict[str, Any]:
+        return tomllib.load(f)
+
+
+@dataclass(slots=True, frozen=True)
 class CourseConfig:
     """Configuration for a single course"""
 
-    def __init__(self, slug: str, data: dict[str, Any]) -> None:
-        self.slug = slug
-        self.secret: str = data["secret"]
-        self.name: str = data["name"]
+    slug: str
+    secret: str
+    name: str
+
+    @classmethod
+    def from_toml(cls, slug: str, data: dict[str, Any]) -> "CourseConfig":
+        """Build a course from its [courses.<slug>] TOML table"""
+        return cls(slug, data["secret"], data["name"])
 
 
 class Settings(BaseSettings):
@@ -26,6 +48,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        arbitrary_types_allowed=True,
     )
 
     # Redis configuration
@@ -49,37 +72,44 @@ class Settings(BaseSettings):
         default=86400, description="Session data TTL after end (seconds)"
     )
 
-    # Courses file path
-    courses_file: str = Field(default="courses.toml", description="Path to courses TOML file")
+    # Courses file path (or an already-open binary stream of TOML)
+    courses_file: str | BufferedIOBase = Field(
+        default="courses.toml", description="Path to courses TOML file"
+    )
 
-    # Courses cache
-    _courses: dict[str, CourseConfig] | None = None
+    # Courses cache (slug -> CourseConfig), built on first load
+    _courses_by_slug: dict[str, CourseConfig] | None = None
 
     def load_courses(self) -> dict[str, CourseConfig]:
         """Load courses from TOML file"""
-        if self._courses is not None:
-            return self._courses
+        if self._courses_by_slug is not None:
+            return self._courses_by_slug
 
-        courses_path = Path(self.courses_file)
-        if not courses_path.exists():
-            raise FileNotFoundError(f"Courses file not found: {self.courses_file}")
+        if isinstance(self.courses_file, BufferedIOBase):
+            data = _load_toml(self.courses_file)
+        else:
+            courses_path = Path(self.courses_file)
+            if not courses_path.exists():
+                raise FileNotFoundError(f"Courses file not found: {self.courses_file}")
 
-        with open(courses_path, "rb") as f:
-            data = tomllib.load(f)
+            with open(courses_path, "rb") as f:
+                data = _load_toml(f)
 
         if "courses" not in data:
             raise ValueError("Invalid courses.toml: missing 'courses' section")
 
-        self._courses = {
-            slug: CourseConfig(slug, course_data)
+        self._courses_by_slug = {
+            slug: CourseConfig.from_toml(slug, course_data)
             for slug, course_data in data["courses"].items()
         }
 
-        return self._courses
+        return self._courses_by_slug
 
     def get_course(self, slug: str) -> CourseConfig | None:
         """Get course configuration by slug"""
-        courses = self.load_courses()
+        courses = self._courses_by_slug
+        if courses is None:
+            courses = self.load_courses()
         return courses.get(slug)
 
 
@@ -3,15 +3,22 @@ Main FastAPI application for In-Class Q&A + Polling Tool
 """
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
+from app.responses import ORJSONResponse
 from app.routes import admin, sse, student
 
 app = FastAPI(
     title="Classroom Q&A",
     description="In-Class Q&A + Polling Tool for UCSD Data Science Lectures",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
+# Compress large responses (archive downloads, exports, pages) for clients that
+# accept gzip; Starlette >= 0.46 leaves text/event-stream (SSE) uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # Define health endpoints before including routers
 # (so they take precedence over the /{course} routes)
 @app.get("/")
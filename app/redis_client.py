@@ -2,15 +2,35 @@
 Redis client for managing session state, questions, and responses
 """
 
-import json
+import functools
 import uuid
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any, cast
 
+import orjson
 import redis
 
 from app.models import EventType, QuestionType
 
+# Event names by type, so the publish path skips the Enum .value descriptor
+_EVENT_NAMES = {event_type: event_type.value for event_type in EventType}
+
+
+@functools.cache
+def connect(redis_url: str) -> redis.Redis:
+    """
+    Get the Redis connection for a URL, created once and shared by every
+    caller so requests reuse its connection pool
+
+    Args:
+        redis_url: Redis server URL
+
+    Returns:
+        Redis client with decoded responses
+    """
+    return redis.from_url(redis_url, decode_responses=True)
+
 
 class RedisClient:
     """Redis client wrapper for all application operations"""
@@ -42,11 +62,10 @@ class RedisClient:
             if old_answer_json then
                 local old_data = cjson.decode(old_answer_json)
                 local old_value = tostring(old_data.resp)
-                redis.call('HINCRBY', counts_key, old_value, -1)
+                local new_count = redis.call('HINCRBY', counts_key, old_value, -1)
 
                 -- Remove count if it reaches 0
-                local new_count = tonumber(redis.call('HGET', counts_key, old_value))
-                if new_count and new_count <= 0 then
+                if new_count <= 0 then
                     redis.call('HDEL', counts_key, old_value)
                 end
             end
@@ -59,6 +78,20 @@ class RedisClient:
             """
         )
 
+        # Lua script for publishing an event in one round trip
+        # Publishes to the course's events channel and its per-event-type channel
+        # (channels are not keys, so they are passed as ARGV)
+        self.publish_event_script = self.redis.register_script(
+            """
+            local events_channel = ARGV[1]
+            local event_channel = ARGV[2]
+            local message = ARGV[3]
+
+            redis.call('PUBLISH', event_channel, message)
+            return redis.call('PUBLISH', events_channel, message)
+            """
+        )
+
     # Key generation helpers
 
     def session_key(self, course: str) -> str:
@@ -89,6 +122,10 @@ class RedisClient:
         """Generate Redis pub/sub channel key for events"""
         return f"course:{course}:events"
 
+    def event_channel_key(self, course: str, event_type: EventType) -> str:
+        """Generate Redis pub/sub channel key for a single event type"""
+        return f"course:{course}:events:{_EVENT_NAMES[event_type]}"
+
     def archive_key(self, course: str, session_id: str) -> str:
         """Generate Redis key for archived session"""
         return f"course:{course}:archive:{session_id}"
@@ -103,30 +140,34 @@ class RedisClient:
 
     # Session operations
 
-    def clear_session_data(self, course: str) -> None:
-        """
-        Clear all current session data (questions, responses, counts, etc.)
-        Does not affect archived sessions.
-
-        Args:
-            course: Course slug
-        """
-        # Find all current session keys (excludes archives)
+    def _session_data_keys(self, course: str) -> list[str]:
+        """Find all current session keys for a course (excludes archives)"""
         pattern = f"course:{course}:*"
-        archive_pattern = f"course:{course}:archive:*"
+        archive_prefix = f"course:{course}:archive:"
 
+        session_keys = []
         cursor = 0
         while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+            cursor, keys = self.redis.scan(cursor, match=pattern, count=1000)
             for key in keys:
-                # Skip archive keys
                 key_str = key if isinstance(key, str) else key.decode()
-                if not key_str.startswith(f"course:{course}:archive:"):
-                    self.redis.delete(key)
+                if not key_str.startswith(archive_prefix):
+                    session_keys.append(key_str)
 
             if cursor == 0:
                 break
 
+        return session_keys
+
+    def _question_ids(self, course: str, session_keys: list[str]) -> list[str]:
+        """Extract the question IDs from a course's session keys (see _session_data_keys)"""
+        prefix = f"course:{course}:q:"
+        return [
+            key.removeprefix(prefix).removesuffix(":meta")
+            for key in session_keys
+            if key.startswith(prefix) and key.endswith(":meta")
+        ]
+
     def start_session(self, course: str) -> None:
         """
         Start a session for a course
@@ -135,36 +176,73 @@ class RedisClient:
         Args:
             course: Course slug
         """
-        # Clear old session data
-        self.clear_session_data(course)
-
-        # Start new session
-        key = self.session_key(course)
-        self.redis.set(key, "1")
-
-    def stop_session(self, course: str, ttl: int | None = None) -> str:
+        session_keys = self._session_data_keys(course)
+
+        # Clear old session data and start the new session atomically, in
+        # one round trip (MULTI/EXEC)
+        pipe = self.redis.pipeline()
+        if session_keys:
+            pipe.unlink(*session_keys)
+        pipe.set(self.session_key(course), "1")
+        pipe.execute()
+
+    def stop_session(
+        self, course: str, ttl: int | None = None, ttl_ms: int | None = None
+    ) -> str:
         """
         Stop a session for a course
-        Archives current session data and clears it.
+        Archives current session data and clears it. Retries if the session's
+        data changes while it is being archived, so nothing is cleared
+        without having been archived.
 
         Args:
             course: Course slug
             ttl: Optional TTL in seconds for archived session (default: 86400 = 24 hours)
+            ttl_ms: Optional TTL in milliseconds for archived session (overrides ttl)
 
         Returns:
             Session ID of archived session
         """
         # Default TTL to 24 hours if not specified
-        if ttl is None:
-            ttl = 86400
-
-        # Archive current session
-        session_id = self.archive_session(course, ttl)
-
-        # Clear current session data
-        self.clear_session_data(course)
+        if ttl_ms is None:
+            ttl_ms = (ttl if ttl is not None else 86400) * 1000
+
+        with self.redis.pipeline() as pipe:
+            while True:
+                # One SCAN finds both the keys to clear and the questions to archive
+                session_keys = self._session_data_keys(course)
+                question_ids = self._question_ids(course, session_keys)
+
+                # WATCH the session keys, plus each question's responses and counts
+                # (which may not exist yet), so an answer written while the
+                # archive is built aborts the EXEC instead of being cleared
+                # without having been archived
+                watch_keys = set(session_keys)
+                for qid in question_ids:
+                    watch_keys.add(self.question_responses_key(course, qid))
+                    watch_keys.add(self.question_counts_key(course, qid))
+
+                try:
+                    if watch_keys:
+                        pipe.watch(*watch_keys)
+                    archive_data = self._build_archive(course, question_ids)
+
+                    # Store the archive and clear current session data in one
+                    # round trip (MULTI/EXEC)
+                    pipe.multi()
+                    pipe.set(
+                        self.archive_key(course, archive_data["session_id"]),
+                        orjson.dumps(archive_data),
+                        px=ttl_ms,
+                    )
+                    if session_keys:
+                        pipe.unlink(*session_keys)
+                    pipe.execute()
+                except redis.WatchError:
+                    # Session data changed while archiving: rebuild from scratch
+                    continue
 
-        return session_id
+                return cast(str, archive_data["session_id"])
 
     def is_session_live(self, course: str) -> bool:
         """
@@ -185,6 +263,36 @@ class RedisClient:
             return value.decode() == "1"
         return str(value) == "1"
 
+    def snapshot(self, course: str) -> dict[str, Any]:
+        """
+        Get a course's live state: session, current question and its metadata
+
+        The session flag and current question ID are read in one pipelined
+        round trip; the question metadata (if there is a current question)
+        in a second.
+
+        Args:
+            course: Course slug
+
+        Returns:
+            Dict with "is_live" (bool), "current_qid" (str or None) and
+            "meta" (question metadata dict or None)
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self.session_key(course))
+        pipe.get(self.current_qid_key(course))
+        live_value, qid = pipe.execute()
+
+        # Handle both decoded and bytes responses
+        if isinstance(live_value, bytes):
+            live_value = live_value.decode()
+        if isinstance(qid, bytes):
+            qid = qid.decode()
+
+        meta = self.get_question_meta(course, qid) if qid else None
+
+        return {"is_live": live_value == "1", "current_qid": qid, "meta": meta}
+
     # Current question operations
 
     def get_current_question(self, course: str) -> str | None:
@@ -260,12 +368,13 @@ class RedisClient:
             "results_shared_at": None,
         }
 
-        # Store metadata
-        key = self.question_meta_key(course, qid)
-        self.redis.set(key, json.dumps(meta))
-
-        # Set as current question
-        self.set_current_question(course, qid)
+        # Store metadata and set as current question in one command
+        self.redis.mset(
+            {
+                self.question_meta_key(course, qid): orjson.dumps(meta),
+                self.current_qid_key(course): qid,
+            }
+        )
 
         return qid
 
@@ -286,27 +395,45 @@ class RedisClient:
         if data is None:
             return None
 
-        return cast(dict[str, Any], json.loads(data))
+        return cast(dict[str, Any], orjson.loads(data))
 
-    def stop_question(self, course: str, qid: str) -> None:
+    def stop_question(self, course: str, qid: str) -> bool:
         """
         Stop a question
 
         Args:
             course: Course slug
             qid: Question ID
+
+        Returns:
+            True if the question was stopped, False if it doesn't exist
         """
-        # Update metadata with ended_at timestamp
-        meta = self.get_question_meta(course, qid)
-        if meta is not None:
-            meta["ended_at"] = datetime.now(UTC).isoformat()
-            key = self.question_meta_key(course, qid)
-            self.redis.set(key, json.dumps(meta))
+        meta_key = self.question_meta_key(course, qid)
+        current_key = self.current_qid_key(course)
+
+        # Read metadata and the current question in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(meta_key)
+        pipe.get(current_key)
+        meta_data, current_qid = pipe.execute()
+
+        if meta_data is None:
+            return False
+
+        # Update metadata with ended_at timestamp, and clear current question
+        # if this is the current one, in one round trip
+        meta = orjson.loads(meta_data)
+        meta["ended_at"] = datetime.now(UTC).isoformat()
+        if isinstance(current_qid, bytes):
+            current_qid = current_qid.decode()
 
-        # Clear current question if this is the current one
-        current_qid = self.get_current_question(course)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.set(meta_key, orjson.dumps(meta))
         if current_qid == qid:
-            self.clear_current_question(course)
+            pipe.delete(current_key)
+        pipe.execute()
+
+        return True
 
     def mark_results_shared(self, course: str, qid: str) -> bool:
         """Mark a question's results as shared with students."""
@@ -322,7 +449,7 @@ class RedisClient:
         meta["results_shared_at"] = datetime.now(UTC).isoformat()
 
         key = self.question_meta_key(course, qid)
-        self.redis.set(key, json.dumps(meta))
+        self.redis.set(key, orjson.dumps(meta))
         return True
 
     # Response operations
@@ -346,15 +473,59 @@ class RedisClient:
         Returns:
             Updated counts dict
         """
-        responses_key = self.question_responses_key(course, qid)
-        counts_key = self.question_counts_key(course, qid)
+        # Execute atomic update script
+        result = self.atomic_answer_script(
+            keys=[
+                self.question_responses_key(course, qid),
+                self.question_counts_key(course, qid),
+            ],
+            args=self._answer_script_args(pid, answer),
+        )
 
+        return self._parse_counts(result)
+
+    def submit_answers(
+        self,
+        course: str,
+        qid: str,
+        entries: Iterable[tuple[str, str | bool | float]],
+    ) -> dict[str, int]:
+        """
+        Submit several answers in one pipelined batch
+
+        Each answer runs the same atomic update script as submit_answer, in
+        order, so each is applied atomically on its own. The batch as a whole
+        is not a transaction: other clients' commands may run between answers.
+        The pipeline costs an extra SCRIPT EXISTS check, so prefer
+        submit_answer for a single answer.
+
+        Args:
+            course: Course slug
+            qid: Question ID
+            entries: (pid, answer) pairs
+
+        Returns:
+            Counts dict after the last answer
+        """
+        keys = [self.question_responses_key(course, qid), self.question_counts_key(course, qid)]
+
+        pipe = self.redis.pipeline(transaction=False)
+        for pid, answer in entries:
+            self.atomic_answer_script(
+                keys=keys, args=self._answer_script_args(pid, answer), client=pipe
+            )
+        results = pipe.execute()
+
+        return self._parse_counts(results[-1]) if results else {}
+
+    def _answer_script_args(self, pid: str, answer: str | bool | float) -> list[str | bytes]:
+        """Build the atomic update script's ARGV for one answer"""
         # Prepare answer data
         answer_data = {
             "ts": datetime.now(UTC).isoformat(),
             "resp": answer,
         }
-        answer_json = json.dumps(answer_data)
+        answer_json = orjson.dumps(answer_data)
 
         # Convert answer to string for counting
         if isinstance(answer, bool):
@@ -362,13 +533,10 @@ class RedisClient:
         else:
             answer_value = str(answer)
 
-        # Execute atomic update script
-        result = self.atomic_answer_script(
-            keys=[responses_key, counts_key],
-            args=[pid, answer_json, answer_value],
-        )
+        return [pid, answer_json, answer_value]
 
-        # Convert result to dict
+    def _parse_counts(self, result: list[Any] | None) -> dict[str, int]:
+        """Convert the atomic update script's HGETALL reply to a counts dict"""
         counts = {}
         if result:
             for i in range(0, len(result), 2):
@@ -398,7 +566,7 @@ class RedisClient:
         if data is None:
             return None
 
-        return cast(dict[str, Any], json.loads(data))
+        return cast(dict[str, Any], orjson.loads(data))
 
     def get_all_responses(self, course: str, qid: str) -> dict[str, dict[str, Any]]:
         """
@@ -412,17 +580,15 @@ class RedisClient:
             Dict mapping PID to response data
         """
         key = self.question_responses_key(course, qid)
-        data = self.redis.hgetall(key)
+        return self._decode_responses(self.redis.hgetall(key))
 
+    def _decode_responses(self, data: dict[Any, Any]) -> dict[str, dict[str, Any]]:
+        """Convert a responses hash (PID -> JSON) to a dict of response data"""
         responses = {}
         for pid_bytes, response_bytes in data.items():
             pid = pid_bytes.decode() if isinstance(pid_bytes, bytes) else pid_bytes
-            response_json = (
-                response_bytes.decode()
-                if isinstance(response_bytes, bytes)
-                else response_bytes
-            )
-            responses[pid] = json.loads(response_json)
+            # orjson parses bytes and str alike
+            responses[pid] = orjson.loads(response_bytes)
 
         return responses
 
@@ -440,8 +606,10 @@ class RedisClient:
             Dict mapping answer value to count
         """
         key = self.question_counts_key(course, qid)
-        data = self.redis.hgetall(key)
+        return self._decode_counts(self.redis.hgetall(key))
 
+    def _decode_counts(self, data: dict[Any, Any]) -> dict[str, int]:
+        """Convert a counts hash (answer -> count) to a dict of ints"""
         counts = {}
         for answer_bytes, count_bytes in data.items():
             answer = (
@@ -452,6 +620,47 @@ class RedisClient:
 
         return counts
 
+    def get_responses_and_counts(
+        self, course: str, qid: str
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, int]]:
+        """
+        Get all responses and the answer counts for a question in one round trip
+
+        Args:
+            course: Course slug
+            qid: Question ID
+
+        Returns:
+            Tuple of (PID -> response data, answer value -> count)
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(self.question_responses_key(course, qid))
+        pipe.hgetall(self.question_counts_key(course, qid))
+        responses_data, counts_data = pipe.execute()
+
+        return self._decode_responses(responses_data), self._decode_counts(counts_data)
+
+    def get_question_meta_and_counts(
+        self, course: str, qid: str
+    ) -> tuple[dict[str, Any] | None, dict[str, int]]:
+        """
+        Get question metadata and the answer counts in one round trip
+
+        Args:
+            course: Course slug
+            qid: Question ID
+
+        Returns:
+            Tuple of (metadata dict or None if not found, answer value -> count)
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self.question_meta_key(course, qid))
+        pipe.hgetall(self.question_counts_key(course, qid))
+        meta_data, counts_data = pipe.execute()
+
+        meta = orjson.loads(meta_data) if meta_data is not None else None
+        return meta, self._decode_counts(counts_data)
+
     # Bulk operations
 
     def get_all_question_ids(self, course: str) -> list[str]:
@@ -470,7 +679,7 @@ class RedisClient:
         # Use SCAN to find all question metadata keys
         cursor = 0
         while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+            cursor, keys = self.redis.scan(cursor, match=pattern, count=1000)
             for key in keys:
                 # Extract question ID from key
                 # Key format: course:{course}:q:{id}:meta
@@ -497,7 +706,7 @@ class RedisClient:
         # Use SCAN to find all keys for this course
         cursor = 0
         while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+            cursor, keys = self.redis.scan(cursor, match=pattern, count=1000)
             for key in keys:
                 self.redis.expire(key, ttl)
 
@@ -512,28 +721,28 @@ class RedisClient:
         """
         Publish an event to the course's pub/sub channel
 
+        The event is also published to a per-event-type channel
+        (course:{course}:events:{event}) so subscribers can let Redis
+        filter for the one event they need.
+
         Args:
             course: Course slug
             event_type: Type of event
             data: Event data
         """
-        channel = self.events_channel_key(course)
-        message = {"event": event_type.value, "data": data}
-        self.redis.publish(channel, json.dumps(message))
+        message = {"event": _EVENT_NAMES[event_type], "data": data}
+        self.publish_event_script(
+            args=[
+                self.events_channel_key(course),
+                self.event_channel_key(course, event_type),
+                orjson.dumps(message),
+            ],
+        )
 
     # Archive operations
 
-    def archive_session(self, course: str, ttl: int = 86400) -> str:
-        """
-        Archive current session data
-
-        Args:
-            course: Course slug
-            ttl: TTL in seconds for archived session (default: 86400 = 24 hours)
-
-        Returns:
-            Session ID of archived session
-        """
+    def _build_archive(self, course: str, question_ids: list[str]) -> dict[str, Any]:
+        """Build the archive data (under a new session ID) for a course's given questions"""
         # Generate session ID (timestamp + short UUID)
         timestamp = int(datetime.now(UTC).timestamp())
         short_uuid = str(uuid.uuid4())[:8]
@@ -543,22 +752,28 @@ class RedisClient:
         started_at = None
         stopped_at = datetime.now(UTC).isoformat()
 
-        # Get all questions
-        question_ids = self.get_all_question_ids(course)
+        # Get the questions' metadata and responses in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        for qid in question_ids:
+            pipe.get(self.question_meta_key(course, qid))
+            pipe.hgetall(self.question_responses_key(course, qid))
+        results = pipe.execute() if question_ids else []
+
         questions_data = []
 
-        for qid in question_ids:
-            # Get question metadata
-            meta = self.get_question_meta(course, qid)
-            if meta is None:
+        for qid, meta_data, responses_data in zip(
+            question_ids, results[::2], results[1::2], strict=True
+        ):
+            if meta_data is None:
                 continue
+            meta = orjson.loads(meta_data)
 
             # Capture started_at from first question
             if started_at is None and "started_at" in meta:
                 started_at = meta["started_at"]
 
             # Get all responses
-            all_responses = self.get_all_responses(course, qid)
+            all_responses = self._decode_responses(responses_data)
 
             # Format responses
             formatted_responses = {}
@@ -588,20 +803,13 @@ class RedisClient:
             questions_data.append(question_export)
 
         # Build archive data
-        archive_data = {
+        return {
             "session_id": session_id,
             "started_at": started_at,
             "stopped_at": stopped_at,
             "questions": questions_data,
         }
 
-        # Store archive
-        key = self.archive_key(course, session_id)
-        self.redis.set(key, json.dumps(archive_data))
-        self.redis.expire(key, ttl)
-
-        return session_id
-
     def get_archived_sessions(self, course: str) -> list[dict[str, Any]]:
         """
         Get list of archived sessions (metadata only)
@@ -613,31 +821,36 @@ class RedisClient:
             List of archive metadata dicts (session_id, started_at, stopped_at, question_count)
         """
         pattern = f"course:{course}:archive:*"
-        archives = []
+        keys = []
 
         cursor = 0
         while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
-            for key in keys:
-                # Get archive data
-                data = self.redis.get(key)
-                if data is None:
-                    continue
+            cursor, batch = self.redis.scan(cursor, match=pattern, count=1000)
+            keys.extend(batch)
+            if cursor == 0:
+                break
 
-                archive = cast(dict[str, Any], json.loads(data))
+        if not keys:
+            return []
 
-                # Extract metadata
-                metadata = {
-                    "session_id": archive["session_id"],
-                    "started_at": archive.get("started_at"),
-                    "stopped_at": archive.get("stopped_at"),
-                    "question_count": len(archive.get("questions", [])),
-                }
+        # Fetch every archive in one round trip (an archive can expire between
+        # SCAN and MGET, in which case its value is None)
+        archives = []
+        for data in self.redis.mget(keys):
+            if data is None:
+                continue
 
-                archives.append(metadata)
+            archive = cast(dict[str, Any], orjson.loads(data))
 
-            if cursor == 0:
-                break
+            # Extract metadata
+            metadata = {
+                "session_id": archive["session_id"],
+                "started_at": archive.get("started_at"),
+                "stopped_at": archive.get("stopped_at"),
+                "question_count": len(archive.get("questions", [])),
+            }
+
+            archives.append(metadata)
 
         # Sort by stopped_at (most recent first)
         archives.sort(
@@ -660,13 +873,25 @@ class RedisClient:
         Returns:
             Archive data dict or None if not found
         """
-        key = self.archive_key(course, session_id)
-        data = self.redis.get(key)
+        data = self.get_archived_session_json(course, session_id)
 
         if data is None:
             return None
 
-        return cast(dict[str, Any], json.loads(data))
+        return cast(dict[str, Any], orjson.loads(data))
+
+    def get_archived_session_json(self, course: str, session_id: str) -> str | None:
+        """
+        Get an archived session as its stored JSON, without decoding it
+
+        Args:
+            course: Course slug
+            session_id: Session ID
+
+        Returns:
+            Archive JSON or None if not found
+        """
+        return cast(str | None, self.redis.get(self.archive_key(course, session_id)))
 
     # Student question operations
 
@@ -704,7 +929,7 @@ class RedisClient:
 
         # Store question
         key = self.question_key(course, question_id)
-        self.redis.set(key, json.dumps(question_data))
+        self.redis.set(key, orjson.dumps(question_data))
         self.redis.expire(key, ttl)
 
         return question_id
@@ -726,7 +951,7 @@ class RedisClient:
         if data is None:
             return None
 
-        return cast(dict[str, Any], json.loads(data))
+        return cast(dict[str, Any], orjson.loads(data))
 
     def get_all_questions(self, course: str) -> list[dict[str, Any]]:
         """
@@ -743,13 +968,13 @@ class RedisClient:
 
         cursor = 0
         while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+            cursor, keys = self.redis.scan(cursor, match=pattern, count=1000)
             for key in keys:
                 data = self.redis.get(key)
                 if data is None:
                     continue
 
-                question = cast(dict[str, Any], json.loads(data))
+                question = cast(dict[str, Any], orjson.loads(data))
                 questions.append(question)
 
             if cursor == 0:
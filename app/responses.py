@@ -0,0 +1,16 @@
+"""
+Response classes for the application
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module"""
+
+    def render(self, content: Any) -> bytes:
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces int/float keys to str
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -5,14 +5,15 @@ Admin routes for course management
 from typing import Annotated
 
 from fastapi import APIRouter, Cookie, Depends, Form, HTTPException, Request, Response
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field, field_validator
 
 import app.config
 from app.auth import create_admin_cookie, require_admin, verify_admin_cookie
 from app.models import EventType, QuestionType
-from app.redis_client import RedisClient
+from app.redis_client import RedisClient, connect
+from app.responses import ORJSONResponse
 from app.services.distribution import build_distribution
 
 router = APIRouter()
@@ -43,10 +44,8 @@ templates.env.filters["format_timestamp"] = format_timestamp
 
 # Dependency to get Redis client
 def get_redis_client() -> RedisClient:
-    """Get Redis client instance"""
-    import redis
-    redis_conn = redis.from_url(app.config.settings.redis_url, decode_responses=True)
-    return RedisClient(redis_conn)
+    """Get Redis client instance (over the shared connection pool)"""
+    return RedisClient(connect(app.config.settings.redis_url))
 
 
 # Dependency to verify admin authentication
@@ -112,7 +111,11 @@ class QuestionResultsShareResponse(BaseModel):
 
 
 @router.get("/{course}/admin", response_class=HTMLResponse)
-async def admin_page(request: Request, course: str) -> Response:
+async def admin_page(
+    request: Request,
+    course: str,
+    redis_client: Annotated[RedisClient, Depends(get_redis_client)],
+) -> Response:
     """
     Admin page - shows login if not authenticated, dashboard if authenticated
     """
@@ -127,11 +130,7 @@ async def admin_page(request: Request, course: str) -> Response:
 
     if is_authenticated:
         # Check if session is currently live
-        import redis
-        redis_conn = redis.from_url(app.config.settings.redis_url, decode_responses=True)
-        redis_wrapper = RedisClient(redis_conn)
-        session_is_live = redis_wrapper.is_session_live(course)
-        redis_conn.close()
+        session_is_live = redis_client.is_session_live(course)
 
         # Show admin dashboard
         return templates.TemplateResponse(
@@ -364,7 +363,8 @@ async def stop_question(
         raise HTTPException(status_code=404, detail="Course not found")
 
     # Stop question in Redis
-    redis_client.stop_question(course, qid)
+    if not redis_client.stop_question(course, qid):
+        raise HTTPException(status_code=404, detail="Question not found")
 
     # Publish SSE event
     redis_client.publish_event(
@@ -452,7 +452,7 @@ async def export_session_data(
     course: str,
     _: Annotated[None, Depends(verify_admin_auth)],
     redis_client: Annotated[RedisClient, Depends(get_redis_client)],
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Export all session data as JSON
     DEPRECATED: Use /{course}/admin/archives instead
@@ -504,7 +504,7 @@ async def export_session_data(
 
         export_data.append(question_export)
 
-    return JSONResponse(content=export_data)
+    return ORJSONResponse(content=export_data)
 
 
 # Archive Routes
@@ -549,7 +549,7 @@ async def download_archive(
     session_id: str,
     _: Annotated[None, Depends(verify_admin_auth)],
     redis_client: Annotated[RedisClient, Depends(get_redis_client)],
-) -> JSONResponse:
+) -> Response:
     """
     Download an archived session as JSON
     """
@@ -558,13 +558,13 @@ async def download_archive(
     if course_config is None:
         raise HTTPException(status_code=404, detail="Course not found")
 
-    # Get archived session
-    archive_data = redis_client.get_archived_session(course, session_id)
+    # Get archived session (already stored as JSON, so send it as is)
+    archive_json = redis_client.get_archived_session_json(course, session_id)
 
-    if archive_data is None:
+    if archive_json is None:
         raise HTTPException(status_code=404, detail="Archived session not found")
 
-    return JSONResponse(content=archive_data)
+    return Response(content=archive_json, media_type="application/json")
 
 
 # Student Q&A Routes
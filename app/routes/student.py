@@ -2,6 +2,7 @@
 Student routes for course participation
 """
 
+import math
 from typing import Annotated
 
 from fastapi import APIRouter, Cookie, Depends, Form, HTTPException, Request, Response
@@ -12,7 +13,8 @@ from pydantic import BaseModel, field_validator
 import app.config
 from app.auth import create_pid_cookie, require_pid, validate_pid_format, verify_pid_cookie
 from app.models import EventType, QuestionType
-from app.redis_client import RedisClient
+from app.redis_client import RedisClient, connect
+from app.responses import ORJSONResponse
 from app.services.distribution import build_distribution
 
 router = APIRouter()
@@ -25,10 +27,8 @@ templates = Jinja2Templates(directory=str(template_dir))
 
 # Dependency to get Redis client
 def get_redis_client() -> RedisClient:
-    """Get Redis client instance"""
-    import redis
-    redis_conn = redis.from_url(app.config.settings.redis_url, decode_responses=True)
-    return RedisClient(redis_conn)
+    """Get Redis client instance (over the shared connection pool)"""
+    return RedisClient(connect(app.config.settings.redis_url))
 
 
 # Dependency to verify PID authentication
@@ -75,7 +75,11 @@ class QuestionResultsResponse(BaseModel):
 
 
 @router.get("/{course}", response_class=HTMLResponse)
-async def student_page(request: Request, course: str) -> Response:
+async def student_page(
+    request: Request,
+    course: str,
+    redis_client: Annotated[RedisClient, Depends(get_redis_client)],
+) -> Response:
     """
     Student page - shows PID entry if not authenticated, main page if authenticated
     """
@@ -90,19 +94,17 @@ async def student_page(request: Request, course: str) -> Response:
 
     if pid is not None:
         # Check if session is live
-        import redis
-        redis_conn = redis.from_url(app.config.settings.redis_url, decode_responses=True)
-        redis_wrapper = RedisClient(redis_conn)
-        session_is_live = redis_wrapper.is_session_live(course)
+        snapshot = redis_client.snapshot(course)
+        session_is_live = snapshot["is_live"]
 
         # Check if there's a current question
         current_question = None
         student_answer = None
 
         if session_is_live:
-            current_qid = redis_wrapper.get_current_question(course)
+            current_qid = snapshot["current_qid"]
             if current_qid:
-                question_meta = redis_wrapper.get_question_meta(course, current_qid)
+                question_meta = snapshot["meta"]
                 # Only show the question if it hasn't ended yet
                 if question_meta and question_meta.get("ended_at") is None:
                     current_question = {
@@ -111,12 +113,10 @@ async def student_page(request: Request, course: str) -> Response:
                         "options": question_meta.get("options"),
                     }
                     # Get student's previous answer if any
-                    response = redis_wrapper.get_response(course, current_qid, pid)
+                    response = redis_client.get_response(course, current_qid, pid)
                     if response:
                         student_answer = response.get("resp")
 
-        redis_conn.close()
-
         # Show main student page
         return templates.TemplateResponse(
             request=request,
@@ -314,6 +314,18 @@ async def submit_answer(
                 status_code=400,
                 detail="Numeric questions require a number or string response",
             )
+        # Answers are stored with orjson, which only takes finite numbers
+        # that fit in 64 bits (it would write NaN as null)
+        if isinstance(response_value, float) and not math.isfinite(response_value):
+            raise HTTPException(
+                status_code=400,
+                detail="Numeric responses must be finite numbers",
+            )
+        if isinstance(response_value, int) and not -(2**63) <= response_value < 2**64:
+            raise HTTPException(
+                status_code=400,
+                detail="Numeric response is out of range",
+            )
 
     # Submit answer using atomic Lua script
     counts = redis_client.submit_answer(course, qid, pid, response_value)
@@ -425,8 +437,7 @@ async def ask_question(
     # Check rate limit
     allowed, retry_after = redis_client.check_ask_rate_limit(course, pid)
     if not allowed:
-        from fastapi.responses import JSONResponse
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=429,
             content={
                 "detail": f"Rate limit exceeded. Please wait {retry_after} seconds before asking another question.",
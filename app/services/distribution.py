@@ -15,33 +15,31 @@ def build_distribution(
 ) -> dict[str, Any] | None:
     """Return distribution data for a question or None if metadata missing."""
 
-    meta = redis_client.get_question_meta(course, question_id)
+    meta, counts = redis_client.get_question_meta_and_counts(course, question_id)
     if meta is None:
         return None
 
     qtype = QuestionType(meta["type"])
     options = meta.get("options")
 
-    counts = redis_client.get_counts(course, question_id)
-    normalized_counts: dict[str, int] = {k: v for k, v in counts.items()}
-
+    # MCQ and TF answers are validated against a fixed set of values, so
+    # report exactly those counts (unanswered ones as 0)
+    normalized_counts: dict[str, int]
     if qtype == QuestionType.MCQ and options:
-        for option in options:
-            normalized_counts.setdefault(option, 0)
-
-    if qtype == QuestionType.TF:
-        normalized_counts.setdefault("true", 0)
-        normalized_counts.setdefault("false", 0)
+        normalized_counts = {option: counts.get(option, 0) for option in options}
+    elif qtype == QuestionType.TF:
+        normalized_counts = {answer: counts.get(answer, 0) for answer in ("true", "false")}
+    else:
+        normalized_counts = counts
 
     total = sum(normalized_counts.values())
-    percentages: dict[str, float] = {}
-
+    percentages: dict[str, float]
     if total > 0:
-        for key, count in normalized_counts.items():
-            percentages[key] = round((count / total) * 100, 2)
+        percentages = {
+            key: round((count / total) * 100, 2) for key, count in normalized_counts.items()
+        }
     else:
-        for key in normalized_counts.keys():
-            percentages[key] = 0.0
+        percentages = dict.fromkeys(normalized_counts, 0.0)
 
     return {
         "question_id": question_id,
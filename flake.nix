@@ -34,11 +34,15 @@
           p.python-multipart
           p.itsdangerous
           p.httpx
+          p.orjson
 
           # Dev dependencies
           p.pytest
           p.pytest-asyncio
           p.pytest-cov
+          p.pytest-xdist
+          p.fakeredis
+          p.lupa
           p.ruff
           p.mypy
         ]);
@@ -51,7 +55,7 @@
 
           shellHook = ''
             echo "Starting Redis server in background..."
-            redis-server --daemonize yes --port 6379 --dir /tmp
+            redis-server --daemonize yes --port 6379 --unixsocket /tmp/redis.sock --dir /tmp --databases 64
 
             echo ""
             echo "=================================="
@@ -63,12 +67,14 @@
             echo ""
             echo "Available commands:"
             echo "  pytest              - Run tests"
+            echo "  pytest -n auto      - Run tests in parallel"
+            echo "  pytest --redis-backend=fakeredis  - Run tests without Redis"
             echo "  pytest --cov        - Run tests with coverage"
             echo "  ruff check .        - Lint code"
             echo "  mypy app            - Type check"
             echo "  uvicorn app.main:app --reload  - Run dev server"
             echo ""
-            echo "Redis is running on localhost:6379"
+            echo "Redis is running on localhost:6379 and /tmp/redis.sock"
             echo "=================================="
             echo ""
           '';
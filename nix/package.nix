@@ -14,6 +14,7 @@ let
     python-multipart
     itsdangerous
     httpx
+    orjson
   ]);
 in
 pythonEnv.pkgs.buildPythonApplication {
@@ -2,52 +2,267 @@
 Pytest configuration and fixtures
 """
 
-from collections.abc import Generator
-from pathlib import Path
+import os
+from collections.abc import AsyncGenerator, Callable, Generator
 
+import httpx
 import pytest
+import pytest_asyncio
 import redis
+import redis.asyncio as aioredis
 from fastapi.testclient import TestClient
+from redis.client import PubSub
 
-from app.config import Settings
+from app.auth import create_admin_cookie, create_pid_cookie
+from app.config import CourseConfig, Settings
+from app.redis_client import RedisClient
+
+# Unix socket the Nix shell's Redis also listens on (skips TCP loopback overhead)
+REDIS_SOCKET_PATH = "/tmp/redis.sock"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --redis-backend option"""
+    parser.addoption(
+        "--redis-backend",
+        choices=("real", "fakeredis"),
+        default="real",
+        help=(
+            "Redis backend for redis_client and the app: a real server (default) or "
+            "in-process fakeredis. With fakeredis, tests that need a server (async "
+            "clients, or marked requires_real_redis) are skipped."
+        ),
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked requires_real_redis when running against fakeredis"""
+    if config.getoption("--redis-backend") != "fakeredis":
+        return
+
+    skip = pytest.mark.skip(reason="requires a real Redis server")
+    for item in items:
+        if "requires_real_redis" in item.keywords:
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope="session")
-def redis_server() -> Generator[str, None, None]:
+def redis_server(request: pytest.FixtureRequest) -> Generator[str, None, None]:
     """
     Fixture that provides a Redis server URL for testing.
     Uses the existing Redis instance from the Nix shell.
+
+    Connects over the Unix socket at REDIS_SOCKET_PATH when it exists, and
+    over TCP on localhost:6379 otherwise.
+
+    Under pytest-xdist each worker gets its own logical database (gw0 -> 1,
+    gw1 -> 2, ...) so per-test FLUSHDB calls don't clobber other workers.
+    Pub/sub channels are server-wide and are not isolated this way.
     """
-    redis_url = "redis://localhost:6379/1"  # Use database 1 for tests
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    db = 1 + int(worker.removeprefix("gw"))  # Database 0 is left for development
+    if os.path.exists(REDIS_SOCKET_PATH):
+        redis_url = f"unix://{REDIS_SOCKET_PATH}?db={db}"
+    else:
+        redis_url = f"redis://localhost:6379/{db}"
     yield redis_url
 
 
+@pytest.fixture(scope="session")
+def redis_pool(redis_server: str) -> Generator[redis.ConnectionPool, None, None]:
+    """
+    Fixture that provides a Redis connection pool shared by the whole test session.
+    Tests should use redis_client, which also resets the database.
+    """
+    pool = redis.ConnectionPool.from_url(redis_server, decode_responses=True)
+
+    # Workers past the server's database count would fail every test with
+    # "DB index is out of range"; stop once with a clear message instead
+    try:
+        redis.Redis(connection_pool=pool).ping()
+    except redis.ResponseError as e:
+        if "out of range" not in str(e):
+            raise
+        db = pool.connection_kwargs["db"]
+        pytest.exit(
+            f"Redis has no database {db} for this pytest-xdist worker; start "
+            "redis-server with more databases (e.g. --databases 64) or use fewer "
+            "workers (-n)",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+
+    yield pool
+
+    pool.disconnect()
+
+
+@pytest.fixture(scope="session")
+def redis_connection(request: pytest.FixtureRequest) -> redis.Redis:
+    """
+    Fixture that provides one Redis client over redis_pool for the whole session,
+    or an in-process fakeredis client under --redis-backend=fakeredis.
+    Tests should use redis_client, which also resets the database.
+    """
+    if request.config.getoption("--redis-backend") == "fakeredis":
+        import fakeredis
+
+        return fakeredis.FakeRedis(decode_responses=True)
+
+    redis_pool: redis.ConnectionPool = request.getfixturevalue("redis_pool")
+    return redis.Redis(connection_pool=redis_pool)
+
+
 @pytest.fixture(scope="function")
-def redis_client(redis_server: str) -> Generator[redis.Redis, None, None]:
+def redis_client(redis_connection: redis.Redis) -> Generator[redis.Redis, None, None]:
     """
     Fixture that provides a Redis client connected to the test database.
     Flushes the database before and after each test.
     """
-    client = redis.from_url(redis_server, decode_responses=True)
+    client = redis_connection
 
-    # Flush test database before test
-    client.flushdb()
+    # Flush test database before test (ASYNC: keys vanish immediately,
+    # memory is reclaimed in the background)
+    client.flushdb(asynchronous=True)
 
     yield client
 
     # Flush test database after test
-    client.flushdb()
-    client.close()
+    client.flushdb(asynchronous=True)
+
+
+@pytest.fixture(scope="session")
+def course_slug() -> str:
+    """
+    Fixture that provides a course slug unique to this pytest-xdist worker
+    ("master" when not distributed, or without xdist). Use it where keys
+    alone don't isolate workers, e.g. pub/sub channels, which are server-wide.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return f"test-course-{worker}"
+
+
+@pytest.fixture(scope="session")
+def session_redis_wrapper(redis_connection: redis.Redis) -> RedisClient:
+    """
+    Fixture that provides one RedisClient wrapper around redis_connection for
+    the whole session, so its Lua scripts are registered once.
+    """
+    return RedisClient(redis_connection)
 
 
 @pytest.fixture(scope="function")
-def test_settings(tmp_path: Path, redis_server: str) -> Settings:
+def redis_wrapper(
+    redis_client: redis.Redis, session_redis_wrapper: RedisClient
+) -> RedisClient:
+    """
+    Fixture that provides the shared RedisClient wrapper, requested through
+    redis_client so the test database is flushed first.
+    """
+    return session_redis_wrapper
+
+
+@pytest.fixture(scope="function")
+def live_session(redis_wrapper: RedisClient) -> RedisClient:
+    """
+    Fixture that makes test-course's session live and provides redis_wrapper.
+    Sets the session flag directly: the database was just flushed, so there is
+    no old session data for start_session to clear.
+    """
+    redis_wrapper.redis.set(redis_wrapper.session_key("test-course"), "1")
+    return redis_wrapper
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_redis(
+    request: pytest.FixtureRequest, redis_server: str
+) -> AsyncGenerator[aioredis.Redis, None]:
+    """
+    Fixture that provides an async Redis client shared by every test in a module.
+    Tests using it must run in the module event loop:
+    @pytest.mark.asyncio(loop_scope="module").
+    Skips dependent tests under --redis-backend=fakeredis.
+    """
+    if request.config.getoption("--redis-backend") == "fakeredis":
+        pytest.skip("requires a real Redis server")
+
+    client = await aioredis.from_url(redis_server, decode_responses=True)
+
+    yield client
+
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_subscribed_pubsub(
+    async_redis: aioredis.Redis, course_slug: str
+) -> AsyncGenerator[aioredis.client.PubSub, None]:
+    """
+    Fixture that provides an async pub/sub connection subscribed to the
+    course_slug course's question_started events channel, shared by every
+    test in a module. Tests using it must run in the module event loop.
+    """
+    pubsub = async_redis.pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(f"course:{course_slug}:events:question_started")
+
+    # Consume the subscribe confirmation (read, then discarded as None)
+    await pubsub.get_message(timeout=1.0)
+
+    yield pubsub
+
+    await pubsub.unsubscribe()
+    await pubsub.close()
+
+
+@pytest.fixture(scope="module")
+def course_events_pubsub(
+    redis_connection: redis.Redis, course_slug: str
+) -> Generator[PubSub, None, None]:
+    """
+    Fixture that provides a pub/sub connection subscribed to the course_slug
+    course's question_started events channel, shared by every test in a module.
+    Tests should use subscribed_pubsub, which also discards stale messages.
+    """
+    pubsub = redis_connection.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(f"course:{course_slug}:events:question_started")
+
+    # Consume the subscribe confirmation (read, then discarded as None)
+    pubsub.get_message(timeout=1.0)
+
+    yield pubsub
+
+    pubsub.close()
+
+
+@pytest.fixture(scope="function")
+def subscribed_pubsub(
+    course_events_pubsub: PubSub, redis_client: redis.Redis
+) -> PubSub:
+    """
+    Fixture that provides a pub/sub connection subscribed to the course_slug
+    course's question_started events channel, with messages published by
+    earlier tests drained.
+    """
+    while course_events_pubsub.get_message(timeout=0) is not None:
+        pass
+
+    return course_events_pubsub
+
+
+@pytest.fixture(scope="session")
+def test_settings(
+    tmp_path_factory: pytest.TempPathFactory, redis_server: str, course_slug: str
+) -> Settings:
     """
     Fixture that provides test settings with a temporary courses file.
+    Shared by the whole session; tests must not mutate it.
+
+    Besides test-course and another-course, the file registers this worker's
+    course_slug, so tests that go through pub/sub can use a course no other
+    pytest-xdist worker publishes to.
     """
     # Create a temporary courses.toml file
-    courses_file = tmp_path / "courses.toml"
-    courses_file.write_text("""
+    courses_file = tmp_path_factory.mktemp("settings") / "courses.toml"
+    courses_file.write_text(f"""
 [courses.test-course]
 secret = "test-secret-123"
 name = "Test Course"
@@ -55,6 +270,10 @@ name = "Test Course"
 [courses.another-course]
 secret = "another-secret-456"
 name = "Another Test Course"
+
+[courses.{course_slug}]
+secret = "worker-secret-789"
+name = "Worker Test Course"
 """)
 
     # Create test settings
@@ -67,27 +286,138 @@ name = "Another Test Course"
     return test_settings
 
 
+@pytest.fixture(scope="session")
+def test_course(test_settings: Settings) -> CourseConfig:
+    """
+    Fixture that provides test-course's configuration from test_settings.
+    """
+    course = test_settings.get_course("test-course")
+    assert course is not None
+    return course
+
+
+@pytest.fixture(scope="session")
+def admin_cookie(test_settings: Settings, test_course: CourseConfig) -> str:
+    """
+    Fixture that provides a signed admin cookie for test-course.
+    Signed once per session; admin cookies are verified without a max age.
+    """
+    return create_admin_cookie("test-course", test_course.secret, test_settings.secret_key)
+
+
 @pytest.fixture(scope="function")
-def client(test_settings: Settings) -> Generator[TestClient, None, None]:
+def student_cookies(test_settings: Settings) -> dict[str, str]:
     """
-    Fixture that provides a FastAPI test client with test settings.
+    Fixture that provides the request cookies for student A12345678.
+    """
+    return {"student_session": create_pid_cookie("A12345678", test_settings.secret_key)}
+
+
+@pytest.fixture(scope="session")
+def app_settings(test_settings: Settings) -> Generator[Settings, None, None]:
+    """
+    Fixture that installs test_settings as the app's global settings for the
+    whole test session.
     """
-    # Override the global settings with test settings
     import app.config
-    from app.main import app as fastapi_app
 
     original_settings = app.config.settings
     app.config.settings = test_settings
 
-    # Create test client
-    test_client = TestClient(fastapi_app)
-
-    yield test_client
+    yield test_settings
 
     # Restore original settings
     app.config.settings = original_settings
 
 
+@pytest.fixture(scope="session")
+def app_redis(
+    session_redis_wrapper: RedisClient,
+) -> Generator[RedisClient, None, None]:
+    """
+    Fixture that makes the app's Redis client dependencies use the shared
+    session_redis_wrapper (a real server or fakeredis, per --redis-backend).
+    """
+    from app.main import app as fastapi_app
+    from app.routes import admin, student
+
+    overrides = {
+        admin.get_redis_client: lambda: session_redis_wrapper,
+        student.get_redis_client: lambda: session_redis_wrapper,
+    }
+    fastapi_app.dependency_overrides.update(overrides)
+
+    yield session_redis_wrapper
+
+    for dependency in overrides:
+        fastapi_app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture(scope="session")
+def app_client(
+    app_settings: Settings, app_redis: RedisClient
+) -> Generator[TestClient, None, None]:
+    """
+    Fixture that provides one FastAPI test client, with test settings, for the
+    whole test session. The client is entered once, so the app's lifespan runs
+    once, after the test settings and Redis overrides are installed.
+    Tests should use client, which also clears cookies.
+    """
+    from app.main import app as fastapi_app
+
+    with TestClient(fastapi_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def client(app_client: TestClient) -> TestClient:
+    """
+    Fixture that provides a FastAPI test client with test settings.
+    """
+    # Don't leak cookies set by a previous test's responses
+    app_client.cookies.clear()
+
+    return app_client
+
+
+@pytest.fixture(scope="function")
+def admin_client(client: TestClient, admin_cookie: str) -> TestClient:
+    """
+    Fixture that provides client with test-course's admin cookie set on the
+    client itself, so requests don't need to pass cookies.
+    """
+    client.cookies.set("admin_session", admin_cookie)
+
+    return client
+
+
+@pytest_asyncio.fixture
+async def aclient(
+    app_settings: Settings, app_redis: RedisClient
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Fixture that provides an async HTTP client with test settings.
+    Requests are handled in-process on the test's event loop (no portal thread).
+    """
+    from app.main import app as fastapi_app
+
+    transport = httpx.ASGITransport(app=fastapi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="function")
+def started_session(admin_client: TestClient) -> Callable[..., httpx.Response]:
+    """
+    Fixture that provides a helper which starts a live session as admin.
+    """
+
+    def _start(course: str = "test-course") -> httpx.Response:
+        return admin_client.post(f"/{course}/admin/session/start")
+
+    return _start
+
+
 @pytest.fixture(scope="function")
 def sample_courses() -> dict[str, dict[str, str]]:
     """
@@ -29,7 +29,7 @@ from app.auth import (
     verify_csrf_token,
     verify_pid_cookie,
 )
-from app.config import Settings
+from app.config import CourseConfig, Settings
 
 
 class TestPIDValidation:
@@ -177,26 +177,22 @@ class TestPIDCookies:
 class TestAdminCookies:
     """Test cases for admin cookie creation and verification"""
 
-    def test_create_admin_cookie(self, test_settings: Settings) -> None:
+    def test_create_admin_cookie(self, test_settings: Settings, test_course: CourseConfig) -> None:
         """Test creating an admin cookie"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         assert cookie is not None
         assert isinstance(cookie, str)
         assert len(cookie) > 0
 
-    def test_verify_admin_cookie_valid(self, test_settings: Settings) -> None:
+    def test_verify_admin_cookie_valid(
+        self, test_settings: Settings, test_course: CourseConfig
+    ) -> None:
         """Test verifying a valid admin cookie"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
         is_valid = verify_admin_cookie(
             cookie, "test-course", test_settings
@@ -205,14 +201,11 @@ class TestAdminCookies:
         assert is_valid is True
 
     def test_verify_admin_cookie_wrong_course(
-        self, test_settings: Settings
+        self, test_settings: Settings, test_course: CourseConfig
     ) -> None:
         """Test that admin cookie for one course doesn't work for another"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         # Try to use it for another course
@@ -229,13 +222,12 @@ class TestAdminCookies:
         )
         assert is_valid is False
 
-    def test_verify_admin_cookie_tampered(self, test_settings: Settings) -> None:
+    def test_verify_admin_cookie_tampered(
+        self, test_settings: Settings, test_course: CourseConfig
+    ) -> None:
         """Test that tampered admin cookie returns False"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
         # Tamper with the cookie
         tampered = cookie[:-5] + "XXXXX"
@@ -275,14 +267,13 @@ class TestAdminCookies:
 
         assert is_valid is False
 
-    def test_admin_cookie_with_expiration(self, test_settings: Settings) -> None:
+    def test_admin_cookie_with_expiration(
+        self, test_settings: Settings, test_course: CourseConfig
+    ) -> None:
         """Test admin cookie with expiration time"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         # Create cookie
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         # Should be valid immediately with max_age=2
@@ -395,13 +386,10 @@ class TestFastAPIDependencies:
 
         assert exc_info.value.status_code == 401
 
-    def test_require_admin_valid(self, test_settings: Settings) -> None:
+    def test_require_admin_valid(self, test_settings: Settings, test_course: CourseConfig) -> None:
         """Test require_admin with valid cookie"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         # Should not raise exception
@@ -422,13 +410,12 @@ class TestFastAPIDependencies:
 
         assert exc_info.value.status_code == 403
 
-    def test_require_admin_wrong_course(self, test_settings: Settings) -> None:
+    def test_require_admin_wrong_course(
+        self, test_settings: Settings, test_course: CourseConfig
+    ) -> None:
         """Test require_admin with cookie for wrong course raises HTTPException"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -436,14 +423,13 @@ class TestFastAPIDependencies:
 
         assert exc_info.value.status_code == 403
 
-    def test_require_admin_expired_cookie(self, test_settings: Settings) -> None:
+    def test_require_admin_expired_cookie(
+        self, test_settings: Settings, test_course: CourseConfig
+    ) -> None:
         """Test require_admin with expired cookie raises HTTPException"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         # Create cookie
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         # Wait a bit
@@ -480,14 +466,11 @@ class TestSecurityEdgeCases:
         assert pid is None
 
     def test_admin_cookie_requires_exact_course_match(
-        self, test_settings: Settings
+        self, test_settings: Settings, test_course: CourseConfig
     ) -> None:
         """Test that admin cookies require exact course slug match"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
         # Try with slightly different course slug
@@ -564,22 +547,18 @@ class TestIntegrationScenarios:
         required_pid = require_pid(cookie, test_settings.secret_key)
         assert required_pid == pid
 
-    def test_full_admin_auth_flow(self, test_settings: Settings) -> None:
+    def test_full_admin_auth_flow(self, test_settings: Settings, test_course: CourseConfig) -> None:
         """Test complete admin authentication flow"""
-        # Step 1: Get course
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        # Step 2: Create cookie with course secret
+        # Step 1: Create cookie with course secret
         cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+            "test-course", test_course.secret, test_settings.secret_key
         )
 
-        # Step 3: Verify cookie
+        # Step 2: Verify cookie
         is_valid = verify_admin_cookie(cookie, "test-course", test_settings)
         assert is_valid is True
 
-        # Step 4: Use in dependency (should not raise)
+        # Step 3: Use in dependency (should not raise)
         require_admin(cookie, "test-course", test_settings)
 
     def test_csrf_protection_flow(self) -> None:
@@ -11,24 +11,91 @@ This test file covers:
 - Course data structure validation
 """
 
+import io
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from app.config import CourseConfig, Settings
+from app.config import CourseConfig, Settings, TOMLDecodeError
+
+# Courses TOML fixtures, fed to Settings as in-memory streams
+
+LONG_SECRET = "a" * 100
+
+INVALID_SYNTAX_TOML = b"""
+[courses.test
+invalid syntax here
+"""
+
+NO_COURSES_SECTION_TOML = b"""
+[settings]
+foo = "bar"
+"""
+
+EMPTY_COURSES_TOML = b"""
+[courses]
+"""
+
+VALID_COURSE_TOML = b"""
+[courses.valid-course]
+secret = "valid-secret"
+name = "Valid Course Name"
+"""
+
+MULTI_COURSE_TOML = b"""
+[courses.course1]
+secret = "secret1"
+name = "Course One"
+
+[courses.course2]
+secret = "secret2"
+name = "Course Two"
+
+[courses.course3]
+secret = "secret3"
+name = "Course Three"
+"""
+
+SPECIAL_NAME_TOML = b"""
+[courses.special-course]
+secret = "secret"
+name = "Course: Data Science & Machine Learning (2025)"
+"""
+
+LONG_SECRET_TOML = f"""
+[courses.long-secret-course]
+secret = "{LONG_SECRET}"
+name = "Long Secret Course"
+""".encode()
+
+SLUG_FORMATS_TOML = b"""
+[courses.dsc80-wi25]
+secret = "s1"
+name = "DSC 80"
+
+[courses.intro-to-python]
+secret = "s2"
+name = "Intro to Python"
+
+[courses.cs101]
+secret = "s3"
+name = "CS 101"
+"""
 
 
 class TestCoursesLoading:
     """Test cases for loading courses from TOML file"""
 
-    def test_load_courses_success(self, test_settings: Settings) -> None:
+    def test_load_courses_success(self, test_settings: Settings, course_slug: str) -> None:
         """Test that courses.toml loads correctly"""
         courses = test_settings.load_courses()
 
         # Check that courses were loaded
-        assert len(courses) == 2
+        assert len(courses) == 3
         assert "test-course" in courses
         assert "another-course" in courses
+        assert course_slug in courses
 
     def test_load_courses_caching(self, test_settings: Settings) -> None:
         """Test that courses are cached after first load"""
@@ -50,45 +117,26 @@ class TestCoursesLoading:
         assert "Courses file not found" in str(exc_info.value)
         assert str(nonexistent_file) in str(exc_info.value)
 
-    def test_invalid_toml_syntax(self, tmp_path: Path) -> None:
+    def test_invalid_toml_syntax(self) -> None:
         """Test that invalid TOML syntax raises an error"""
-        import tomllib
+        settings = Settings(courses_file=io.BytesIO(INVALID_SYNTAX_TOML))
 
-        invalid_file = tmp_path / "invalid.toml"
-        invalid_file.write_text("""
-[courses.test
-invalid syntax here
-""")
-
-        settings = Settings(courses_file=str(invalid_file))
-
-        # tomllib will raise a TOMLDecodeError
-        with pytest.raises(tomllib.TOMLDecodeError):
+        # The active TOML backend raises its own decode error
+        with pytest.raises(TOMLDecodeError):
             settings.load_courses()
 
-    def test_missing_courses_section(self, tmp_path: Path) -> None:
+    def test_missing_courses_section(self) -> None:
         """Test that TOML without 'courses' section raises ValueError"""
-        invalid_file = tmp_path / "no_courses.toml"
-        invalid_file.write_text("""
-[settings]
-foo = "bar"
-""")
-
-        settings = Settings(courses_file=str(invalid_file))
+        settings = Settings(courses_file=io.BytesIO(NO_COURSES_SECTION_TOML))
 
         with pytest.raises(ValueError) as exc_info:
             settings.load_courses()
 
         assert "missing 'courses' section" in str(exc_info.value)
 
-    def test_empty_courses_section(self, tmp_path: Path) -> None:
+    def test_empty_courses_section(self) -> None:
         """Test that empty courses section returns empty dict"""
-        empty_file = tmp_path / "empty.toml"
-        empty_file.write_text("""
-[courses]
-""")
-
-        settings = Settings(courses_file=str(empty_file))
+        settings = Settings(courses_file=io.BytesIO(EMPTY_COURSES_TOML))
         courses = settings.load_courses()
 
         assert len(courses) == 0
@@ -105,12 +153,21 @@ class TestCourseConfig:
             "name": "Test Course",
         }
 
-        course = CourseConfig("test-slug", data)
+        course = CourseConfig.from_toml("test-slug", data)
 
         assert course.slug == "test-slug"
         assert course.secret == "test-secret"
         assert course.name == "Test Course"
 
+    def test_course_config_is_immutable(self) -> None:
+        """Test that CourseConfig is frozen and has no instance dict"""
+        course = CourseConfig("test-slug", "test-secret", "Test Course")
+
+        with pytest.raises(AttributeError):
+            course.secret = "changed"  # type: ignore[misc]
+
+        assert not hasattr(course, "__dict__")
+
     def test_course_config_missing_secret(self) -> None:
         """Test that missing secret raises KeyError"""
         data = {
@@ -118,7 +175,7 @@ class TestCourseConfig:
         }
 
         with pytest.raises(KeyError):
-            CourseConfig("test-slug", data)
+            CourseConfig.from_toml("test-slug", data)
 
     def test_course_config_missing_name(self) -> None:
         """Test that missing name raises KeyError"""
@@ -127,7 +184,7 @@ class TestCourseConfig:
         }
 
         with pytest.raises(KeyError):
-            CourseConfig("test-slug", data)
+            CourseConfig.from_toml("test-slug", data)
 
     def test_course_config_empty_secret(self) -> None:
         """Test that empty secret is allowed but stored"""
@@ -136,7 +193,7 @@ class TestCourseConfig:
             "name": "Test Course",
         }
 
-        course = CourseConfig("test-slug", data)
+        course = CourseConfig.from_toml("test-slug", data)
         assert course.secret == ""
 
     def test_course_config_empty_name(self) -> None:
@@ -146,7 +203,7 @@ class TestCourseConfig:
             "name": "",
         }
 
-        course = CourseConfig("test-slug", data)
+        course = CourseConfig.from_toml("test-slug", data)
         assert course.name == ""
 
 
@@ -231,15 +288,24 @@ class TestEnvironmentVariables:
 
     def test_redis_url_configuration(self) -> None:
         """Test Redis URL configuration"""
-        settings = Settings(redis_url="redis://prod-server:6380/2")
+        settings = Settings.model_construct(redis_url="redis://prod-server:6380/2")
         assert settings.redis_url == "redis://prod-server:6380/2"
 
     def test_rate_limiting_configuration(self) -> None:
         """Test rate limiting configuration"""
-        settings = Settings(rate_limit_ask=10, rate_limit_window=30)
+        settings = Settings.model_construct(rate_limit_ask=10, rate_limit_window=30)
         assert settings.rate_limit_ask == 10
         assert settings.rate_limit_window == 30
 
+    def test_settings_validation(self) -> None:
+        """Test that the normal constructor validates and coerces values"""
+        settings = Settings(rate_limit_ask="5", session_ttl="3600")
+        assert settings.rate_limit_ask == 5
+        assert settings.session_ttl == 3600
+
+        with pytest.raises(ValidationError):
+            Settings(rate_limit_window="not-a-number")
+
 
 class TestSecretValidation:
     """Test cases for secret validation"""
@@ -278,25 +344,16 @@ class TestSecretValidation:
         """Test that configured secrets are not empty"""
         courses = test_settings.load_courses()
 
-        for _slug, course in courses.items():
-            # All test courses should have non-empty secrets
-            assert course.secret != ""
-            assert len(course.secret) > 0
+        # All test courses should have non-empty secrets
+        assert all(course.secret for course in courses.values())
 
 
 class TestDataStructureValidation:
     """Test cases for validating course data structure"""
 
-    def test_valid_course_structure(self, tmp_path: Path) -> None:
+    def test_valid_course_structure(self) -> None:
         """Test that valid course structure is accepted"""
-        valid_file = tmp_path / "valid.toml"
-        valid_file.write_text("""
-[courses.valid-course]
-secret = "valid-secret"
-name = "Valid Course Name"
-""")
-
-        settings = Settings(courses_file=str(valid_file))
+        settings = Settings(courses_file=io.BytesIO(VALID_COURSE_TOML))
         courses = settings.load_courses()
 
         assert len(courses) == 1
@@ -307,85 +364,34 @@ name = "Valid Course Name"
         assert course.secret == "valid-secret"
         assert course.name == "Valid Course Name"
 
-    def test_multiple_courses_structure(self, tmp_path: Path) -> None:
+    def test_multiple_courses_structure(self) -> None:
         """Test that multiple courses are loaded correctly"""
-        multi_file = tmp_path / "multi.toml"
-        multi_file.write_text("""
-[courses.course1]
-secret = "secret1"
-name = "Course One"
-
-[courses.course2]
-secret = "secret2"
-name = "Course Two"
-
-[courses.course3]
-secret = "secret3"
-name = "Course Three"
-""")
-
-        settings = Settings(courses_file=str(multi_file))
+        settings = Settings(courses_file=io.BytesIO(MULTI_COURSE_TOML))
         courses = settings.load_courses()
 
-        assert len(courses) == 3
-        assert "course1" in courses
-        assert "course2" in courses
-        assert "course3" in courses
+        assert set(courses) == {"course1", "course2", "course3"}
 
-    def test_course_with_special_characters_in_name(self, tmp_path: Path) -> None:
+    def test_course_with_special_characters_in_name(self) -> None:
         """Test course with special characters in name"""
-        special_file = tmp_path / "special.toml"
-        special_file.write_text("""
-[courses.special-course]
-secret = "secret"
-name = "Course: Data Science & Machine Learning (2025)"
-""")
-
-        settings = Settings(courses_file=str(special_file))
+        settings = Settings(courses_file=io.BytesIO(SPECIAL_NAME_TOML))
         courses = settings.load_courses()
 
         course = courses["special-course"]
         assert course.name == "Course: Data Science & Machine Learning (2025)"
 
-    def test_course_with_long_secret(self, tmp_path: Path) -> None:
+    def test_course_with_long_secret(self) -> None:
         """Test course with a long secret"""
-        long_file = tmp_path / "long.toml"
-        long_secret = "a" * 100
-        long_file.write_text(f"""
-[courses.long-secret-course]
-secret = "{long_secret}"
-name = "Long Secret Course"
-""")
-
-        settings = Settings(courses_file=str(long_file))
+        settings = Settings(courses_file=io.BytesIO(LONG_SECRET_TOML))
         courses = settings.load_courses()
 
         course = courses["long-secret-course"]
-        assert course.secret == long_secret
+        assert course.secret == LONG_SECRET
         assert len(course.secret) == 100
 
-    def test_course_slug_formats(self, tmp_path: Path) -> None:
+    def test_course_slug_formats(self) -> None:
         """Test various valid course slug formats"""
-        slug_file = tmp_path / "slugs.toml"
-        slug_file.write_text("""
-[courses.dsc80-wi25]
-secret = "s1"
-name = "DSC 80"
-
-[courses.intro-to-python]
-secret = "s2"
-name = "Intro to Python"
-
-[courses.cs101]
-secret = "s3"
-name = "CS 101"
-""")
-
-        settings = Settings(courses_file=str(slug_file))
+        settings = Settings(courses_file=io.BytesIO(SLUG_FORMATS_TOML))
         courses = settings.load_courses()
 
-        assert len(courses) == 3
-        assert "dsc80-wi25" in courses
-        assert "intro-to-python" in courses
-        assert "cs101" in courses
+        assert set(courses) == {"dsc80-wi25", "intro-to-python", "cs101"}
 
@@ -8,50 +8,60 @@ Tests the full flow:
 4. Admin stops question
 """
 
+import re
+from collections.abc import Callable
+from typing import Any
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from redis import Redis
 
-from app.auth import create_admin_cookie, create_pid_cookie
-from app.config import Settings
 from app.redis_client import RedisClient
 
+# Matches the rejection detail for answers to a stopped question
+ENDED_DETAIL = re.compile(r"ended", re.IGNORECASE)
+
 
 class TestCompleteFlow:
     """Test complete question flow from creation to answer submission to stop"""
 
-    def test_complete_mcq_flow(
-        self, client: TestClient, test_settings: Settings, redis_client: Redis
+    @pytest.mark.parametrize(
+        "question_data,response_value,count_key",
+        [
+            # MCQ answers are counted by option
+            ({"type": "mcq", "options": ["A", "B", "C", "D"]}, "A", "A"),
+            # Boolean true is converted to lowercase "true" for counting in Redis
+            ({"type": "tf"}, "true", "true"),
+            ({"type": "numeric"}, "42", "42"),
+        ],
+        ids=["mcq", "tf", "numeric"],
+    )
+    def test_complete_flow(
+        self,
+        client: TestClient,
+        admin_client: TestClient,
+        redis_wrapper: RedisClient,
+        student_cookies: dict[str, str],
+        started_session: Callable[..., httpx.Response],
+        question_data: dict[str, Any],
+        response_value: str,
+        count_key: str,
     ) -> None:
         """
-        Test complete MCQ flow:
+        Test complete flow for each question type:
         1. Admin starts session
-        2. Admin creates MCQ question
+        2. Admin creates question
         3. Student submits answer
         4. Admin stops question
         """
-        # Setup
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-        student_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
-
         # 1. Admin starts session
-        response = client.post(
-            "/test-course/admin/session/start",
-            cookies={"admin_session": admin_cookie},
-        )
-        assert response.status_code == 200
+        assert started_session().status_code == 200
         print("\n✓ Session started")
 
-        # 2. Admin creates MCQ question (using form data)
-        response = client.post(
+        # 2. Admin creates question (using form data)
+        response = admin_client.post(
             "/test-course/admin/question",
-            cookies={"admin_session": admin_cookie},
-            data={"type": "mcq", "options": ["A", "B", "C", "D"]},
+            data=question_data,
         )
         assert response.status_code == 200, f"Question creation failed: {response.text}"
         data = response.json()
@@ -61,25 +71,21 @@ class TestCompleteFlow:
         # 3. Student submits answer (using form data)
         response = client.post(
             "/test-course/answer",
-            cookies={"student_session": student_cookie},
-            data={"question_id": question_id, "response": "A"},
+            cookies=student_cookies,
+            data={"question_id": question_id, "response": response_value},
         )
         assert response.status_code == 200, f"Answer submission failed: {response.text}"
         data = response.json()
         assert data["status"] == "submitted"
-        assert data["counts"]["A"] == 1
+        assert data["counts"][count_key] == 1
         print("✓ Student answer submitted")
 
         # 4. Admin stops question
-        response = client.post(
-            f"/test-course/admin/question/{question_id}/stop",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.post(f"/test-course/admin/question/{question_id}/stop")
         assert response.status_code == 200, f"Stop question failed: {response.text}"
         print("✓ Question stopped")
 
         # Verify question is marked as ended
-        redis_wrapper = RedisClient(redis_client)
         meta = redis_wrapper.get_question_meta("test-course", question_id)
         assert meta is not None
         assert meta["ended_at"] is not None
@@ -88,108 +94,10 @@ class TestCompleteFlow:
         # Verify student can no longer submit answer after question stopped
         response = client.post(
             "/test-course/answer",
-            cookies={"student_session": student_cookie},
-            data={"question_id": question_id, "response": "B"},
+            cookies=student_cookies,
+            data={"question_id": question_id, "response": response_value},
         )
         assert response.status_code == 400
-        assert "ended" in response.json()["detail"].lower()
+        body = response.json()
+        assert ENDED_DETAIL.search(body["detail"])
         print("✓ Answer submission after stop correctly rejected")
-
-    def test_complete_tf_flow(
-        self, client: TestClient, test_settings: Settings, redis_client: Redis
-    ) -> None:
-        """
-        Test complete True/False flow
-        """
-        # Setup
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-        student_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
-
-        # Start session
-        response = client.post(
-            "/test-course/admin/session/start",
-            cookies={"admin_session": admin_cookie},
-        )
-        assert response.status_code == 200
-
-        # Create T/F question
-        response = client.post(
-            "/test-course/admin/question",
-            cookies={"admin_session": admin_cookie},
-            data={"type": "tf"},
-        )
-        assert response.status_code == 200
-        question_id = response.json()["question_id"]
-
-        # Student submits answer (boolean value as string from form data)
-        response = client.post(
-            "/test-course/answer",
-            cookies={"student_session": student_cookie},
-            data={"question_id": question_id, "response": "true"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "submitted"
-        # Boolean true is converted to lowercase "true" for counting in Redis
-        assert "true" in data["counts"]
-
-        # Stop question
-        response = client.post(
-            f"/test-course/admin/question/{question_id}/stop",
-            cookies={"admin_session": admin_cookie},
-        )
-        assert response.status_code == 200
-
-    def test_complete_numeric_flow(
-        self, client: TestClient, test_settings: Settings, redis_client: Redis
-    ) -> None:
-        """
-        Test complete numeric flow
-        """
-        # Setup
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-        student_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
-
-        # Start session
-        response = client.post(
-            "/test-course/admin/session/start",
-            cookies={"admin_session": admin_cookie},
-        )
-        assert response.status_code == 200
-
-        # Create numeric question
-        response = client.post(
-            "/test-course/admin/question",
-            cookies={"admin_session": admin_cookie},
-            data={"type": "numeric"},
-        )
-        assert response.status_code == 200
-        question_id = response.json()["question_id"]
-
-        # Student submits numeric answer
-        response = client.post(
-            "/test-course/answer",
-            cookies={"student_session": student_cookie},
-            data={"question_id": question_id, "response": "42"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "submitted"
-        assert "42" in data["counts"]
-
-        # Stop question
-        response = client.post(
-            f"/test-course/admin/question/{question_id}/stop",
-            cookies={"admin_session": admin_cookie},
-        )
-        assert response.status_code == 200
@@ -15,200 +15,249 @@ This test file covers:
 
 import json
 import time
+from datetime import UTC, datetime, tzinfo
+from typing import Any
+from unittest.mock import MagicMock, patch
 
+import pytest
 import redis
 
 from app.models import EventType, QuestionType
 from app.redis_client import RedisClient
 
 
-class TestKeyGeneration:
-    """Test cases for Redis key generation helpers"""
-
-    def test_session_key(self, redis_client: redis.Redis) -> None:
-        """Test session key generation"""
-        client = RedisClient(redis_client)
-
-        key = client.session_key("test-course")
-        assert key == "course:test-course:session:live"
-
-    def test_current_qid_key(self, redis_client: redis.Redis) -> None:
-        """Test current question ID key generation"""
-        client = RedisClient(redis_client)
-
-        key = client.current_qid_key("test-course")
-        assert key == "course:test-course:current_qid"
-
-    def test_question_meta_key(self, redis_client: redis.Redis) -> None:
-        """Test question metadata key generation"""
-        client = RedisClient(redis_client)
-
-        key = client.question_meta_key("test-course", "q-123")
-        assert key == "course:test-course:q:q-123:meta"
+@pytest.fixture(scope="module")
+def key_client() -> RedisClient:
+    """
+    RedisClient over a mock connection: key helpers only format strings,
+    so these tests need neither a Redis round trip nor a flushed database.
+    """
+    return RedisClient(MagicMock(spec=redis.Redis))
 
-    def test_question_responses_key(self, redis_client: redis.Redis) -> None:
-        """Test question responses key generation"""
-        client = RedisClient(redis_client)
 
-        key = client.question_responses_key("test-course", "q-123")
-        assert key == "course:test-course:q:q-123:responses"
-
-    def test_question_counts_key(self, redis_client: redis.Redis) -> None:
-        """Test question counts key generation"""
-        client = RedisClient(redis_client)
-
-        key = client.question_counts_key("test-course", "q-123")
-        assert key == "course:test-course:q:q-123:counts"
-
-    def test_numeric_cache_key(self, redis_client: redis.Redis) -> None:
-        """Test numeric cache key generation"""
-        client = RedisClient(redis_client)
-
-        key = client.numeric_cache_key("test-course", "q-123")
-        assert key == "course:test-course:q:q-123:numeric_cache"
-
-    def test_events_channel_key(self, redis_client: redis.Redis) -> None:
-        """Test events channel key generation"""
-        client = RedisClient(redis_client)
+class TestKeyGeneration:
+    """Test cases for Redis key generation helpers"""
 
-        key = client.events_channel_key("test-course")
-        assert key == "course:test-course:events"
+    @pytest.mark.parametrize(
+        "attr,args,expected",
+        [
+            ("session_key", ("test-course",), "course:test-course:session:live"),
+            ("current_qid_key", ("test-course",), "course:test-course:current_qid"),
+            ("question_meta_key", ("test-course", "q-123"), "course:test-course:q:q-123:meta"),
+            (
+                "question_responses_key",
+                ("test-course", "q-123"),
+                "course:test-course:q:q-123:responses",
+            ),
+            (
+                "question_counts_key",
+                ("test-course", "q-123"),
+                "course:test-course:q:q-123:counts",
+            ),
+            (
+                "numeric_cache_key",
+                ("test-course", "q-123"),
+                "course:test-course:q:q-123:numeric_cache",
+            ),
+            ("events_channel_key", ("test-course",), "course:test-course:events"),
+            (
+                "event_channel_key",
+                ("test-course", EventType.QUESTION_STARTED),
+                "course:test-course:events:question_started",
+            ),
+        ],
+    )
+    def test_key(
+        self, key_client: RedisClient, attr: str, args: tuple[Any, ...], expected: str
+    ) -> None:
+        """Test key generation"""
+        assert getattr(key_client, attr)(*args) == expected
 
 
 class TestSessionOperations:
     """Test cases for session management operations"""
 
-    def test_start_session(self, redis_client: redis.Redis) -> None:
+    def test_start_session(self, redis_client: redis.Redis, redis_wrapper: RedisClient) -> None:
         """Test starting a session"""
-        client = RedisClient(redis_client)
-
         # Initially no session
-        assert not client.is_session_live("test-course")
+        assert not redis_wrapper.is_session_live("test-course")
 
         # Start session
-        client.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Session should be live
-        assert client.is_session_live("test-course")
+        assert redis_wrapper.is_session_live("test-course")
 
         # Check Redis directly
-        key = client.session_key("test-course")
+        key = redis_wrapper.session_key("test-course")
         assert redis_client.get(key) == "1"
 
-    def test_stop_session_without_ttl(self, redis_client: redis.Redis) -> None:
+    def test_stop_session_without_ttl(self, redis_wrapper: RedisClient) -> None:
         """Test stopping a session without TTL"""
-        client = RedisClient(redis_client)
-
         # Start session
-        client.start_session("test-course")
-        assert client.is_session_live("test-course")
+        redis_wrapper.start_session("test-course")
+        assert redis_wrapper.is_session_live("test-course")
 
         # Stop session
-        client.stop_session("test-course")
+        redis_wrapper.stop_session("test-course")
 
         # Session should no longer be live
-        assert not client.is_session_live("test-course")
+        assert not redis_wrapper.is_session_live("test-course")
 
-    def test_stop_session_with_ttl(self, redis_client: redis.Redis) -> None:
+    def test_stop_session_with_ttl(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient
+    ) -> None:
         """Test stopping a session archives data and clears current session"""
-        client = RedisClient(redis_client)
-
         # Start session and create a question
-        client.start_session("test-course")
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
 
         # Stop session with TTL
-        session_id = client.stop_session("test-course", ttl=10)
+        session_id = redis_wrapper.stop_session("test-course", ttl=10)
 
         # Session should no longer be live
-        assert not client.is_session_live("test-course")
+        assert not redis_wrapper.is_session_live("test-course")
 
         # Current session keys should be deleted
-        session_key = client.session_key("test-course")
+        session_key = redis_wrapper.session_key("test-course")
         assert redis_client.ttl(session_key) == -2  # Key doesn't exist
 
-        meta_key = client.question_meta_key("test-course", qid)
+        meta_key = redis_wrapper.question_meta_key("test-course", qid)
         assert redis_client.ttl(meta_key) == -2  # Key doesn't exist
 
         # Archive key should exist with TTL
-        archive_key = client.archive_key("test-course", session_id)
+        archive_key = redis_wrapper.archive_key("test-course", session_id)
         ttl = redis_client.ttl(archive_key)
         assert 0 < ttl <= 10
 
-    def test_is_session_live_nonexistent(self, redis_client: redis.Redis) -> None:
+    def test_stop_session_archives_answer_written_during_stop(
+        self, redis_wrapper: RedisClient
+    ) -> None:
+        """Test that an answer landing while the archive is built is archived, not lost"""
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        redis_wrapper.submit_answer("test-course", qid, "A11111111", "A")
+
+        build_archive = redis_wrapper._build_archive
+        builds = []
+
+        def build_then_answer(course: str, question_ids: list[str]) -> dict[str, Any]:
+            archive = build_archive(course, question_ids)
+            if not builds:
+                # A student answers after the responses were read
+                redis_wrapper.submit_answer("test-course", qid, "A22222222", "B")
+            builds.append(archive)
+            return archive
+
+        with patch.object(redis_wrapper, "_build_archive", side_effect=build_then_answer):
+            session_id = redis_wrapper.stop_session("test-course")
+
+        # The first attempt was aborted by WATCH and the archive rebuilt
+        assert len(builds) == 2
+        archive = redis_wrapper.get_archived_session("test-course", session_id)
+        assert archive is not None
+        assert set(archive["questions"][0]["responses"]) == {"A11111111", "A22222222"}
+        assert not redis_wrapper.is_session_live("test-course")
+
+    def test_is_session_live_nonexistent(self, redis_wrapper: RedisClient) -> None:
         """Test checking if nonexistent session is live"""
-        client = RedisClient(redis_client)
-
-        assert not client.is_session_live("nonexistent-course")
+        assert not redis_wrapper.is_session_live("nonexistent-course")
 
-    def test_multiple_courses_sessions(self, redis_client: redis.Redis) -> None:
+    def test_multiple_courses_sessions(self, redis_wrapper: RedisClient) -> None:
         """Test that different courses have independent sessions"""
-        client = RedisClient(redis_client)
-
         # Start session for course1
-        client.start_session("course1")
-        assert client.is_session_live("course1")
-        assert not client.is_session_live("course2")
+        redis_wrapper.start_session("course1")
+        assert redis_wrapper.is_session_live("course1")
+        assert not redis_wrapper.is_session_live("course2")
 
         # Start session for course2
-        client.start_session("course2")
-        assert client.is_session_live("course1")
-        assert client.is_session_live("course2")
+        redis_wrapper.start_session("course2")
+        assert redis_wrapper.is_session_live("course1")
+        assert redis_wrapper.is_session_live("course2")
 
         # Stop course1
-        client.stop_session("course1")
-        assert not client.is_session_live("course1")
-        assert client.is_session_live("course2")
+        redis_wrapper.stop_session("course1")
+        assert not redis_wrapper.is_session_live("course1")
+        assert redis_wrapper.is_session_live("course2")
 
 
 class TestCurrentQuestion:
     """Test cases for current question management"""
 
-    def test_get_current_question_none(self, redis_client: redis.Redis) -> None:
+    def test_get_current_question_none(self, redis_wrapper: RedisClient) -> None:
         """Test getting current question when none exists"""
-        client = RedisClient(redis_client)
-
-        qid = client.get_current_question("test-course")
+        qid = redis_wrapper.get_current_question("test-course")
         assert qid is None
 
-    def test_set_current_question(self, redis_client: redis.Redis) -> None:
+    def test_set_current_question(self, redis_wrapper: RedisClient) -> None:
         """Test setting current question"""
-        client = RedisClient(redis_client)
+        redis_wrapper.set_current_question("test-course", "q-123")
 
-        client.set_current_question("test-course", "q-123")
-
-        qid = client.get_current_question("test-course")
+        qid = redis_wrapper.get_current_question("test-course")
         assert qid == "q-123"
 
-    def test_clear_current_question(self, redis_client: redis.Redis) -> None:
+    def test_clear_current_question(self, redis_wrapper: RedisClient) -> None:
         """Test clearing current question"""
-        client = RedisClient(redis_client)
-
-        client.set_current_question("test-course", "q-123")
-        assert client.get_current_question("test-course") == "q-123"
+        redis_wrapper.set_current_question("test-course", "q-123")
+        assert redis_wrapper.get_current_question("test-course") == "q-123"
 
-        client.clear_current_question("test-course")
-        assert client.get_current_question("test-course") is None
+        redis_wrapper.clear_current_question("test-course")
+        assert redis_wrapper.get_current_question("test-course") is None
 
-    def test_update_current_question(self, redis_client: redis.Redis) -> None:
+    def test_update_current_question(self, redis_wrapper: RedisClient) -> None:
         """Test updating current question"""
-        client = RedisClient(redis_client)
+        redis_wrapper.set_current_question("test-course", "q-123")
+        assert redis_wrapper.get_current_question("test-course") == "q-123"
+
+        redis_wrapper.set_current_question("test-course", "q-456")
+        assert redis_wrapper.get_current_question("test-course") == "q-456"
+
+
+class TestSnapshot:
+    """Test cases for reading a course's live state at once"""
+
+    def test_snapshot_no_session(self, redis_wrapper: RedisClient) -> None:
+        """Test snapshot of a course with no session"""
+        assert redis_wrapper.snapshot("test-course") == {
+            "is_live": False,
+            "current_qid": None,
+            "meta": None,
+        }
+
+    def test_snapshot_live_without_question(self, redis_wrapper: RedisClient) -> None:
+        """Test snapshot of a live session with no current question"""
+        redis_wrapper.start_session("test-course")
 
-        client.set_current_question("test-course", "q-123")
-        assert client.get_current_question("test-course") == "q-123"
+        snapshot = redis_wrapper.snapshot("test-course")
+        assert snapshot["is_live"]
+        assert snapshot["current_qid"] is None
+        assert snapshot["meta"] is None
 
-        client.set_current_question("test-course", "q-456")
-        assert client.get_current_question("test-course") == "q-456"
+    def test_snapshot_with_current_question(self, redis_wrapper: RedisClient) -> None:
+        """Test snapshot matches the individual getters"""
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        redis_wrapper.set_current_question("test-course", qid)
+
+        snapshot = redis_wrapper.snapshot("test-course")
+        assert snapshot["is_live"] == redis_wrapper.is_session_live("test-course")
+        assert snapshot["current_qid"] == qid
+        assert snapshot["meta"] == redis_wrapper.get_question_meta("test-course", qid)
+
+    def test_snapshot_courses_independent(self, redis_wrapper: RedisClient) -> None:
+        """Test that snapshots of different courses are independent"""
+        redis_wrapper.start_session("course1")
+
+        assert redis_wrapper.snapshot("course1")["is_live"]
+        assert not redis_wrapper.snapshot("course2")["is_live"]
 
 
 class TestQuestionMetadata:
     """Test cases for question metadata CRUD operations"""
 
-    def test_create_question_mcq(self, redis_client: redis.Redis) -> None:
+    def test_create_question_mcq(self, redis_wrapper: RedisClient) -> None:
         """Test creating an MCQ question"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C", "D"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C", "D"])
 
         # Should return a question ID
         assert qid is not None
@@ -216,10 +265,10 @@ class TestQuestionMetadata:
         assert qid.startswith("q-")
 
         # Question should be set as current
-        assert client.get_current_question("test-course") == qid
+        assert redis_wrapper.get_current_question("test-course") == qid
 
         # Metadata should be stored
-        meta = client.get_question_meta("test-course", qid)
+        meta = redis_wrapper.get_question_meta("test-course", qid)
         assert meta is not None
         assert meta["id"] == qid
         assert meta["type"] == QuestionType.MCQ.value
@@ -227,238 +276,291 @@ class TestQuestionMetadata:
         assert "started_at" in meta
         assert meta["ended_at"] is None
 
-    def test_create_question_tf(self, redis_client: redis.Redis) -> None:
+    def test_create_question_tf(self, redis_wrapper: RedisClient) -> None:
         """Test creating a True/False question"""
-        client = RedisClient(redis_client)
+        qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
-        qid = client.create_question("test-course", QuestionType.TF)
-
-        meta = client.get_question_meta("test-course", qid)
+        meta = redis_wrapper.get_question_meta("test-course", qid)
         assert meta["type"] == QuestionType.TF.value
         assert meta["options"] is None
 
-    def test_create_question_numeric(self, redis_client: redis.Redis) -> None:
+    def test_create_question_numeric(self, redis_wrapper: RedisClient) -> None:
         """Test creating a numeric question"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.NUMERIC)
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
-        meta = client.get_question_meta("test-course", qid)
+        meta = redis_wrapper.get_question_meta("test-course", qid)
         assert meta["type"] == QuestionType.NUMERIC.value
         assert meta["options"] is None
 
-    def test_get_question_meta_nonexistent(self, redis_client: redis.Redis) -> None:
+    def test_get_question_meta_nonexistent(self, redis_wrapper: RedisClient) -> None:
         """Test getting metadata for nonexistent question"""
-        client = RedisClient(redis_client)
-
-        meta = client.get_question_meta("test-course", "nonexistent-q")
+        meta = redis_wrapper.get_question_meta("test-course", "nonexistent-q")
         assert meta is None
 
-    def test_stop_question(self, redis_client: redis.Redis) -> None:
+    def test_stop_question(self, redis_wrapper: RedisClient) -> None:
         """Test stopping a question"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
         # Initially not ended
-        meta = client.get_question_meta("test-course", qid)
+        meta = redis_wrapper.get_question_meta("test-course", qid)
         assert meta["ended_at"] is None
 
         # Stop the question
-        client.stop_question("test-course", qid)
+        assert redis_wrapper.stop_question("test-course", qid) is True
 
         # Should have ended_at timestamp
-        meta = client.get_question_meta("test-course", qid)
+        meta = redis_wrapper.get_question_meta("test-course", qid)
         assert meta["ended_at"] is not None
         assert isinstance(meta["ended_at"], str)
 
         # Should clear current question
-        assert client.get_current_question("test-course") is None
+        assert redis_wrapper.get_current_question("test-course") is None
 
-    def test_multiple_questions_for_course(self, redis_client: redis.Redis) -> None:
-        """Test creating multiple questions for a course"""
-        client = RedisClient(redis_client)
+    def test_stop_nonexistent_question(self, redis_wrapper: RedisClient) -> None:
+        """Test stopping a nonexistent question leaves the current question alone"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+
+        assert redis_wrapper.stop_question("test-course", "nonexistent-q") is False
+        assert redis_wrapper.get_current_question("test-course") == qid
 
-        qid1 = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
-        qid2 = client.create_question("test-course", QuestionType.TF)
+    def test_multiple_questions_for_course(self, redis_wrapper: RedisClient) -> None:
+        """Test creating multiple questions for a course"""
+        qid1 = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        qid2 = redis_wrapper.create_question("test-course", QuestionType.TF)
 
         # Both should exist
-        assert client.get_question_meta("test-course", qid1) is not None
-        assert client.get_question_meta("test-course", qid2) is not None
+        assert redis_wrapper.get_question_meta("test-course", qid1) is not None
+        assert redis_wrapper.get_question_meta("test-course", qid2) is not None
 
         # Last one should be current
-        assert client.get_current_question("test-course") == qid2
+        assert redis_wrapper.get_current_question("test-course") == qid2
 
 
 class TestResponseOperations:
     """Test cases for response storage and retrieval"""
 
-    def test_submit_answer_mcq(self, redis_client: redis.Redis) -> None:
+    def test_submit_answer_mcq(self, redis_wrapper: RedisClient) -> None:
         """Test submitting an MCQ answer"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
 
         # Submit answer
-        client.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Retrieve response
-        response = client.get_response("test-course", qid, "A12345678")
+        response = redis_wrapper.get_response("test-course", qid, "A12345678")
         assert response is not None
         assert response["resp"] == "A"
         assert "ts" in response
 
-    def test_submit_answer_tf(self, redis_client: redis.Redis) -> None:
+    def test_submit_answer_tf(self, redis_wrapper: RedisClient) -> None:
         """Test submitting a True/False answer"""
-        client = RedisClient(redis_client)
+        qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
-        qid = client.create_question("test-course", QuestionType.TF)
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", True)
 
-        client.submit_answer("test-course", qid, "A12345678", True)
-
-        response = client.get_response("test-course", qid, "A12345678")
+        response = redis_wrapper.get_response("test-course", qid, "A12345678")
         assert response["resp"] is True
 
-    def test_submit_answer_numeric(self, redis_client: redis.Redis) -> None:
+    def test_submit_answer_numeric(self, redis_wrapper: RedisClient) -> None:
         """Test submitting a numeric answer"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.NUMERIC)
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
-        client.submit_answer("test-course", qid, "A12345678", 42.5)
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", 42.5)
 
-        response = client.get_response("test-course", qid, "A12345678")
+        response = redis_wrapper.get_response("test-course", qid, "A12345678")
         assert response["resp"] == 42.5
 
-    def test_update_answer(self, redis_client: redis.Redis) -> None:
+    def test_update_answer(
+        self, redis_wrapper: RedisClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test updating an answer (changing from A to B)"""
-        client = RedisClient(redis_client)
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
 
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+        # Stamp the two submissions a second apart instead of sleeping
+        stamps = iter(
+            [
+                datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+                datetime(2025, 1, 1, 12, 0, 1, tzinfo=UTC),
+            ]
+        )
+
+        class SteppingDatetime(datetime):
+            @classmethod
+            def now(cls, tz: tzinfo | None = None) -> datetime:
+                return next(stamps)
+
+        monkeypatch.setattr("app.redis_client.datetime", SteppingDatetime)
 
         # Submit initial answer
-        client.submit_answer("test-course", qid, "A12345678", "A")
-        response1 = client.get_response("test-course", qid, "A12345678")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        response1 = redis_wrapper.get_response("test-course", qid, "A12345678")
         assert response1["resp"] == "A"
         ts1 = response1["ts"]
 
-        # Wait a tiny bit to ensure timestamp changes
-        time.sleep(0.01)
-
         # Update answer
-        client.submit_answer("test-course", qid, "A12345678", "B")
-        response2 = client.get_response("test-course", qid, "A12345678")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "B")
+        response2 = redis_wrapper.get_response("test-course", qid, "A12345678")
         assert response2["resp"] == "B"
         ts2 = response2["ts"]
 
         # Timestamp should be updated
         assert ts2 > ts1
 
-    def test_get_response_nonexistent(self, redis_client: redis.Redis) -> None:
-        """Test getting response for nonexistent PID"""
-        client = RedisClient(redis_client)
+    def test_submit_answers_batch(self, redis_wrapper: RedisClient) -> None:
+        """Test submitting several answers in one batch, including an update"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+
+        counts = redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [("A11111111", "A"), ("A22222222", "A"), ("A11111111", "B")],
+        )
+
+        # Returned counts reflect every answer, applied in order
+        assert counts == {"A": 1, "B": 1}
+        response = redis_wrapper.get_response("test-course", qid, "A11111111")
+        assert response is not None
+        assert response["resp"] == "B"
+
+    def test_submit_answers_empty(self, redis_wrapper: RedisClient) -> None:
+        """Test that an empty batch is a no-op"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        assert redis_wrapper.submit_answers("test-course", qid, []) == {}
 
-        response = client.get_response("test-course", qid, "A99999999")
+    def test_get_response_nonexistent(self, redis_wrapper: RedisClient) -> None:
+        """Test getting response for nonexistent PID"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+
+        response = redis_wrapper.get_response("test-course", qid, "A99999999")
         assert response is None
 
-    def test_get_all_responses(self, redis_client: redis.Redis) -> None:
+    def test_get_all_responses(self, redis_wrapper: RedisClient) -> None:
         """Test getting all responses for a question"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
 
         # Submit multiple answers
-        client.submit_answer("test-course", qid, "A11111111", "A")
-        client.submit_answer("test-course", qid, "A22222222", "B")
-        client.submit_answer("test-course", qid, "A33333333", "A")
+        redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [
+                ("A11111111", "A"),
+                ("A22222222", "B"),
+                ("A33333333", "A"),
+            ],
+        )
 
         # Get all responses
-        responses = client.get_all_responses("test-course", qid)
+        responses = redis_wrapper.get_all_responses("test-course", qid)
 
-        assert len(responses) == 3
-        assert "A11111111" in responses
-        assert "A22222222" in responses
-        assert "A33333333" in responses
-        assert responses["A11111111"]["resp"] == "A"
-        assert responses["A22222222"]["resp"] == "B"
-        assert responses["A33333333"]["resp"] == "A"
+        assert {pid: response["resp"] for pid, response in responses.items()} == {
+            "A11111111": "A",
+            "A22222222": "B",
+            "A33333333": "A",
+        }
 
-    def test_get_all_responses_empty(self, redis_client: redis.Redis) -> None:
+    def test_get_all_responses_empty(self, redis_wrapper: RedisClient) -> None:
         """Test getting all responses when none exist"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
-        responses = client.get_all_responses("test-course", qid)
+        responses = redis_wrapper.get_all_responses("test-course", qid)
         assert responses == {}
 
 
 class TestCountAggregation:
     """Test cases for count aggregation"""
 
-    def test_get_counts_mcq(self, redis_client: redis.Redis) -> None:
-        """Test getting counts for MCQ question"""
-        client = RedisClient(redis_client)
+    def test_get_responses_and_counts(self, redis_wrapper: RedisClient) -> None:
+        """Test reading responses and counts together"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.TF)
+        redis_wrapper.submit_answers(
+            "test-course", qid, [("A11111111", True), ("A22222222", False)]
+        )
+
+        responses, counts = redis_wrapper.get_responses_and_counts("test-course", qid)
+
+        assert responses == redis_wrapper.get_all_responses("test-course", qid)
+        assert counts == {"true": 1, "false": 1}
 
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+    def test_get_question_meta_and_counts(self, redis_wrapper: RedisClient) -> None:
+        """Test reading question metadata and counts together"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        redis_wrapper.submit_answer("test-course", qid, "A11111111", "B")
+
+        meta, counts = redis_wrapper.get_question_meta_and_counts("test-course", qid)
+
+        assert meta == redis_wrapper.get_question_meta("test-course", qid)
+        assert counts == {"B": 1}
+
+        meta, counts = redis_wrapper.get_question_meta_and_counts("test-course", "nonexistent-q")
+        assert meta is None
+        assert counts == {}
+
+    def test_get_counts_mcq(self, redis_wrapper: RedisClient) -> None:
+        """Test getting counts for MCQ question"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
 
         # Submit various answers
-        client.submit_answer("test-course", qid, "A11111111", "A")
-        client.submit_answer("test-course", qid, "A22222222", "B")
-        client.submit_answer("test-course", qid, "A33333333", "A")
-        client.submit_answer("test-course", qid, "A44444444", "C")
-        client.submit_answer("test-course", qid, "A55555555", "A")
+        redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [
+                ("A11111111", "A"),
+                ("A22222222", "B"),
+                ("A33333333", "A"),
+                ("A44444444", "C"),
+                ("A55555555", "A"),
+            ],
+        )
 
         # Get counts
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
 
         assert counts["A"] == 3
         assert counts["B"] == 1
         assert counts["C"] == 1
 
-    def test_get_counts_tf(self, redis_client: redis.Redis) -> None:
+    def test_get_counts_tf(self, redis_wrapper: RedisClient) -> None:
         """Test getting counts for True/False question"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.TF)
+        qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
-        client.submit_answer("test-course", qid, "A11111111", True)
-        client.submit_answer("test-course", qid, "A22222222", False)
-        client.submit_answer("test-course", qid, "A33333333", True)
+        redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [
+                ("A11111111", True),
+                ("A22222222", False),
+                ("A33333333", True),
+            ],
+        )
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
 
         assert counts["true"] == 2
         assert counts["false"] == 1
 
-    def test_get_counts_empty(self, redis_client: redis.Redis) -> None:
+    def test_get_counts_empty(self, redis_wrapper: RedisClient) -> None:
         """Test getting counts when no answers submitted"""
-        client = RedisClient(redis_client)
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
-
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
         assert counts == {}
 
-    def test_counts_update_on_answer_change(self, redis_client: redis.Redis) -> None:
+    def test_counts_update_on_answer_change(self, redis_wrapper: RedisClient) -> None:
         """Test that counts update correctly when student changes answer"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
 
         # Initial submissions
-        client.submit_answer("test-course", qid, "A11111111", "A")
-        client.submit_answer("test-course", qid, "A22222222", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A11111111", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A22222222", "A")
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
         assert counts["A"] == 2
 
         # Student changes answer from A to B
-        client.submit_answer("test-course", qid, "A11111111", "B")
+        redis_wrapper.submit_answer("test-course", qid, "A11111111", "B")
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
         assert counts["A"] == 1
         assert counts["B"] == 1
 
@@ -466,64 +568,112 @@ class TestCountAggregation:
 class TestAtomicAnswerUpdate:
     """Test cases for atomic answer updates using Lua script"""
 
-    def test_atomic_update_creates_counts(self, redis_client: redis.Redis) -> None:
+    def test_atomic_update_creates_counts(self, redis_wrapper: RedisClient) -> None:
         """Test that atomic update creates initial counts"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
         # First submission should create count
-        client.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
         assert counts["A"] == 1
 
-    def test_atomic_update_increments_new(self, redis_client: redis.Redis) -> None:
+    def test_atomic_update_increments_new(self, redis_wrapper: RedisClient) -> None:
         """Test that atomic update increments new answer count"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
-        client.submit_answer("test-course", qid, "A11111111", "A")
-        client.submit_answer("test-course", qid, "A22222222", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A11111111", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A22222222", "A")
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
         assert counts["A"] == 2
 
-    def test_atomic_update_decrements_old(self, redis_client: redis.Redis) -> None:
+    def test_atomic_update_decrements_old(self, redis_wrapper: RedisClient) -> None:
         """Test that atomic update decrements old answer count"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
 
         # Submit initial answer
-        client.submit_answer("test-course", qid, "A12345678", "A")
-        assert client.get_counts("test-course", qid)["A"] == 1
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        assert redis_wrapper.get_counts("test-course", qid)["A"] == 1
 
         # Change answer
-        client.submit_answer("test-course", qid, "A12345678", "B")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "B")
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
         assert counts.get("A", 0) == 0
         assert counts["B"] == 1
 
-    def test_atomic_update_concurrent_safety(self, redis_client: redis.Redis) -> None:
+    def test_atomic_update_runs_cached_script(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient
+    ) -> None:
+        """Test that the script is cached server-side and run by its SHA"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        sha = redis_wrapper.atomic_answer_script.sha
+
+        # The first call loads the script if the server doesn't have it yet
+        redis_wrapper.submit_answer("test-course", qid, "A11111111", "A")
+        assert redis_client.script_exists(sha) == [True]
+
+        # Later calls, from any RedisClient, run it by SHA (EVALSHA) without
+        # resending the source (EVAL)
+        with (
+            patch.object(
+                redis.Redis, "evalsha", autospec=True, side_effect=redis.Redis.evalsha
+            ) as evalsha,
+            patch.object(redis.Redis, "eval", autospec=True, side_effect=redis.Redis.eval) as eval_,
+        ):
+            counts = RedisClient(redis_client).submit_answer(
+                "test-course", qid, "A22222222", "B"
+            )
+
+        assert counts == {"A": 1, "B": 1}
+        assert evalsha.call_count == 1
+        assert evalsha.call_args.args[1] == sha
+        eval_.assert_not_called()
+
+    def test_atomic_update_pipelined_fanout(self, redis_wrapper: RedisClient) -> None:
+        """Test that many interleaved atomic updates keep counts consistent"""
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+
+        # Send 60 interleaved atomic updates in one pipelined batch
+        redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [
+                (f"A{start_pid + i:08d}", answer)
+                for i in range(20)
+                for start_pid, answer in ((10000, "A"), (20000, "B"), (30000, "C"))
+            ],
+        )
+
+        responses, counts = redis_wrapper.get_responses_and_counts("test-course", qid)
+        assert counts["A"] == 20
+        assert counts["B"] == 20
+        assert counts["C"] == 20
+
+        # Verify total responses
+        assert len(responses) == 60
+
+    def test_atomic_update_concurrent_safety(self, redis_wrapper: RedisClient) -> None:
         """Test that concurrent updates maintain consistency"""
         import threading
 
-        client = RedisClient(redis_client)
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B", "C"])
+
+        batches = ((10000, "A"), (20000, "B"), (30000, "C"), (40000, "A"), (50000, "B"))
+        expected = {
+            f"A{start_pid + i:08d}": answer for start_pid, answer in batches for i in range(2)
+        }
 
         # Simulate concurrent submissions
         def submit_answers(start_pid: int, count: int, answer: str) -> None:
             for i in range(count):
                 pid = f"A{start_pid + i:08d}"
-                client.submit_answer("test-course", qid, pid, answer)
+                redis_wrapper.submit_answer("test-course", qid, pid, answer)
 
         threads = [
-            threading.Thread(target=submit_answers, args=(10000, 20, "A")),
-            threading.Thread(target=submit_answers, args=(20000, 20, "B")),
-            threading.Thread(target=submit_answers, args=(30000, 20, "C")),
+            threading.Thread(target=submit_answers, args=(start_pid, 2, answer))
+            for start_pid, answer in batches
         ]
 
         for t in threads:
@@ -531,80 +681,90 @@ class TestAtomicAnswerUpdate:
         for t in threads:
             t.join()
 
-        counts = client.get_counts("test-course", qid)
-        assert counts["A"] == 20
-        assert counts["B"] == 20
-        assert counts["C"] == 20
-
-        # Verify total responses
-        responses = client.get_all_responses("test-course", qid)
-        assert len(responses) == 60
+        responses, counts = redis_wrapper.get_responses_and_counts("test-course", qid)
+        assert counts == {"A": 4, "B": 4, "C": 2}
+        assert {pid: response["resp"] for pid, response in responses.items()} == expected
 
 
 class TestTTLExpiration:
     """Test cases for TTL expiration"""
 
-    def test_ttl_not_set_on_active_session(self, redis_client: redis.Redis) -> None:
+    def test_ttl_not_set_on_active_session(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient
+    ) -> None:
         """Test that TTL is not set on active session keys"""
-        client = RedisClient(redis_client)
-
-        client.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        session_key = client.session_key("test-course")
+        session_key = redis_wrapper.session_key("test-course")
         ttl = redis_client.ttl(session_key)
 
         # -1 means no TTL set
         assert ttl == -1
 
-    def test_ttl_set_on_session_stop(self, redis_client: redis.Redis) -> None:
-        """Test that TTL is set when session stops"""
-        client = RedisClient(redis_client)
-
-        client.start_session("test-course")
-        qid = client.create_question("test-course", QuestionType.MCQ, ["A", "B"])
-        client.submit_answer("test-course", qid, "A12345678", "A")
+    def test_ttl_set_on_session_stop(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient
+    ) -> None:
+        """Test that the archive gets the TTL and live keys are cleared when session stops"""
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Stop with TTL
-        client.stop_session("test-course", ttl=60)
-
-        # All keys should have TTL
-        keys_to_check = [
-            client.session_key("test-course"),
-            client.current_qid_key("test-course"),
-            client.question_meta_key("test-course", qid),
-            client.question_responses_key("test-course", qid),
-            client.question_counts_key("test-course", qid),
+        session_id = redis_wrapper.stop_session("test-course", ttl=5)
+
+        live_keys = [
+            redis_wrapper.session_key("test-course"),
+            redis_wrapper.current_qid_key("test-course"),
+            redis_wrapper.question_meta_key("test-course", qid),
+            redis_wrapper.question_responses_key("test-course", qid),
+            redis_wrapper.question_counts_key("test-course", qid),
         ]
 
-        for key in keys_to_check:
-            if redis_client.exists(key):
-                ttl = redis_client.ttl(key)
-                assert 0 < ttl <= 60
+        # Fetch live key EXISTS and archive PTTL in one round trip
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.exists(*live_keys)
+        pipe.pttl(redis_wrapper.archive_key("test-course", session_id))
+        live_count, archive_pttl = pipe.execute()
+
+        assert live_count == 0
+        assert 0 < archive_pttl <= 5000
+
+    def test_ttl_ms_on_session_stop(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient
+    ) -> None:
+        """Test that a millisecond TTL overrides the TTL in seconds"""
+        redis_wrapper.start_session("test-course")
+
+        session_id = redis_wrapper.stop_session("test-course", ttl=60, ttl_ms=1500)
 
-    def test_ttl_expiration_cleanup(self, redis_client: redis.Redis) -> None:
-        """Test that keys actually expire after TTL"""
-        client = RedisClient(redis_client)
+        archive_pttl = redis_client.pttl(redis_wrapper.archive_key("test-course", session_id))
+        assert 0 < archive_pttl <= 1500
 
-        client.start_session("test-course")
-        client.stop_session("test-course", ttl=1)
+    def test_ttl_expiration_cleanup(self, redis_wrapper: RedisClient) -> None:
+        """Test that archives actually expire after their TTL"""
+        redis_wrapper.start_session("test-course")
+        session_id = redis_wrapper.stop_session("test-course", ttl_ms=50)
+        assert redis_wrapper.get_archived_session("test-course", session_id) is not None
 
-        # Wait for expiration
-        time.sleep(2)
+        # Poll until Redis expires the archive (bounded, so a missing TTL fails)
+        deadline = time.monotonic() + 2
+        while redis_wrapper.get_archived_session("test-course", session_id) is not None:
+            assert time.monotonic() < deadline, "archive did not expire"
+            time.sleep(0.01)
 
-        # Session should not be live
-        assert not client.is_session_live("test-course")
+        assert redis_wrapper.get_archived_sessions("test-course") == []
 
 
 class TestPubSubEvents:
     """Test cases for pub/sub message publishing"""
 
-    def test_publish_event(self, redis_client: redis.Redis) -> None:
+    def test_publish_event(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient, course_slug: str
+    ) -> None:
         """Test publishing an event to the channel"""
-        client = RedisClient(redis_client)
-
         # Subscribe to channel
         pubsub = redis_client.pubsub()
-        channel = client.events_channel_key("test-course")
+        channel = redis_wrapper.events_channel_key(course_slug)
         pubsub.subscribe(channel)
 
         # Skip subscription confirmation message
@@ -614,7 +774,7 @@ class TestPubSubEvents:
 
         # Publish event
         event_data = {"question_id": "q-123", "type": "mcq"}
-        client.publish_event("test-course", EventType.QUESTION_STARTED, event_data)
+        redis_wrapper.publish_event(course_slug, EventType.QUESTION_STARTED, event_data)
 
         # Receive event
         msg = pubsub.get_message(timeout=1)
@@ -632,26 +792,56 @@ class TestPubSubEvents:
 
         pubsub.close()
 
-    def test_publish_multiple_events(self, redis_client: redis.Redis) -> None:
-        """Test publishing multiple events"""
-        client = RedisClient(redis_client)
-
-        pubsub = redis_client.pubsub()
-        channel = client.events_channel_key("test-course")
-        pubsub.subscribe(channel)
+    def test_publish_event_to_event_type_channel(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient, course_slug: str
+    ) -> None:
+        """Test that events are also published to their per-event-type channel"""
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(redis_wrapper.event_channel_key(course_slug, EventType.QUESTION_STARTED))
         pubsub.get_message(timeout=1)  # Skip subscribe message
 
-        # Publish multiple events
-        client.publish_event("test-course", EventType.SESSION_STARTED, {})
-        client.publish_event("test-course", EventType.QUESTION_STARTED, {"question_id": "q-1"})
-        client.publish_event("test-course", EventType.QUESTION_STOPPED, {"question_id": "q-1"})
+        # Only the matching event type reaches the narrow channel
+        redis_wrapper.publish_event(course_slug, EventType.SESSION_STARTED, {})
+        redis_wrapper.publish_event(
+            course_slug, EventType.QUESTION_STARTED, {"question_id": "q-1"}
+        )
+
+        msg = pubsub.get_message(timeout=1)
+        assert msg is not None
+        data = json.loads(msg["data"])
+        assert data["event"] == EventType.QUESTION_STARTED.value
+        assert data["data"]["question_id"] == "q-1"
+
+        assert pubsub.get_message(timeout=0.1) is None
+
+        pubsub.close()
 
-        # Receive all events
-        events = []
-        for _ in range(3):
-            msg = pubsub.get_message(timeout=1)
-            if msg and msg["type"] == "message":
-                events.append(json.loads(msg["data"]))
+    def test_publish_multiple_events(
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient, course_slug: str
+    ) -> None:
+        """Test publishing multiple events"""
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        channel = redis_wrapper.events_channel_key(course_slug)
+        pubsub.subscribe(channel)
+        pubsub.get_message(timeout=1)  # Wait for the (discarded) subscribe confirmation
+
+        # Publish multiple events in one round trip
+        pipe = redis_client.pipeline()
+        batch = RedisClient(pipe)
+        batch.publish_event(course_slug, EventType.SESSION_STARTED, {})
+        batch.publish_event(course_slug, EventType.QUESTION_STARTED, {"question_id": "q-1"})
+        batch.publish_event(course_slug, EventType.QUESTION_STOPPED, {"question_id": "q-1"})
+        pipe.execute()
+
+        # Drain all events under one overall deadline, reading raw
+        # [kind, channel, data] replies (no per-message dict building)
+        raw = []
+        deadline = time.monotonic() + 1.0
+        while len(raw) < 3 and (remaining := deadline - time.monotonic()) > 0:
+            response = pubsub.parse_response(block=False, timeout=remaining)
+            if response and response[0] == "message":
+                raw.append(response)
+        events = [json.loads(data) for _, _, data in raw]
 
         assert len(events) == 3
         assert events[0]["event"] == EventType.SESSION_STARTED.value
@@ -661,27 +851,26 @@ class TestPubSubEvents:
         pubsub.close()
 
     def test_multiple_courses_independent_channels(
-        self, redis_client: redis.Redis
+        self, redis_client: redis.Redis, redis_wrapper: RedisClient, course_slug: str
     ) -> None:
         """Test that different courses have independent pub/sub channels"""
-        client = RedisClient(redis_client)
-
         # Subscribe to course1
         pubsub1 = redis_client.pubsub()
-        pubsub1.subscribe(client.events_channel_key("course1"))
+        pubsub1.subscribe(redis_wrapper.events_channel_key(f"{course_slug}-1"))
         pubsub1.get_message(timeout=1)  # Skip subscribe
 
         # Subscribe to course2
         pubsub2 = redis_client.pubsub()
-        pubsub2.subscribe(client.events_channel_key("course2"))
+        pubsub2.subscribe(redis_wrapper.events_channel_key(f"{course_slug}-2"))
         pubsub2.get_message(timeout=1)  # Skip subscribe
 
         # Publish to course1
-        client.publish_event("course1", EventType.SESSION_STARTED, {})
+        redis_wrapper.publish_event(f"{course_slug}-1", EventType.SESSION_STARTED, {})
 
-        # Only course1 subscriber should receive
+        # Only course1 subscriber should receive (by the time msg1 arrives,
+        # anything sent to course2 would already be waiting)
         msg1 = pubsub1.get_message(timeout=1)
-        msg2 = pubsub2.get_message(timeout=1)
+        msg2 = pubsub2.get_message(timeout=0.1)
 
         assert msg1 is not None
         assert msg1["type"] == "message"
@@ -695,61 +884,63 @@ class TestEdgeCases:
     """Test edge cases and error conditions"""
 
     def test_submit_answer_to_nonexistent_question(
-        self, redis_client: redis.Redis
+        self, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting answer to nonexistent question"""
-        client = RedisClient(redis_client)
-
         # Should not raise error, just store the answer
-        client.submit_answer("test-course", "nonexistent-q", "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", "nonexistent-q", "A12345678", "A")
 
         # Answer should be stored
-        response = client.get_response("test-course", "nonexistent-q", "A12345678")
+        response = redis_wrapper.get_response("test-course", "nonexistent-q", "A12345678")
         assert response is not None
 
-    def test_stop_nonexistent_question(self, redis_client: redis.Redis) -> None:
+    def test_stop_nonexistent_question(self, redis_wrapper: RedisClient) -> None:
         """Test stopping a nonexistent question"""
-        client = RedisClient(redis_client)
-
         # Should not raise error
-        client.stop_question("test-course", "nonexistent-q")
+        redis_wrapper.stop_question("test-course", "nonexistent-q")
 
-    def test_get_counts_for_numeric_question(self, redis_client: redis.Redis) -> None:
+    def test_get_counts_for_numeric_question(self, redis_wrapper: RedisClient) -> None:
         """Test getting counts for numeric question returns all unique values"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.NUMERIC)
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
-        client.submit_answer("test-course", qid, "A11111111", 42)
-        client.submit_answer("test-course", qid, "A22222222", 42)
-        client.submit_answer("test-course", qid, "A33333333", 43)
+        redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [
+                ("A11111111", 42),
+                ("A22222222", 42),
+                ("A33333333", 43),
+            ],
+        )
 
-        counts = client.get_counts("test-course", qid)
+        counts = redis_wrapper.get_counts("test-course", qid)
 
         # Numeric values should be stringified for counting
         assert counts["42"] == 2
         assert counts["43"] == 1
 
-    def test_empty_course_slug(self, redis_client: redis.Redis) -> None:
+    def test_empty_course_slug(self, redis_wrapper: RedisClient) -> None:
         """Test operations with empty course slug"""
-        client = RedisClient(redis_client)
-
         # Should work but use empty slug in key
-        key = client.session_key("")
+        key = redis_wrapper.session_key("")
         assert key == "course::session:live"
 
-    def test_special_characters_in_answer(self, redis_client: redis.Redis) -> None:
+    def test_special_characters_in_answer(self, redis_wrapper: RedisClient) -> None:
         """Test submitting answers with special characters"""
-        client = RedisClient(redis_client)
-
-        qid = client.create_question("test-course", QuestionType.NUMERIC)
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
         # Submit various formats
-        client.submit_answer("test-course", qid, "A11111111", "1/2")
-        client.submit_answer("test-course", qid, "A22222222", "0.5")
-        client.submit_answer("test-course", qid, "A33333333", "½")
-
-        counts = client.get_counts("test-course", qid)
+        redis_wrapper.submit_answers(
+            "test-course",
+            qid,
+            [
+                ("A11111111", "1/2"),
+                ("A22222222", "0.5"),
+                ("A33333333", "½"),
+            ],
+        )
+
+        counts = redis_wrapper.get_counts("test-course", qid)
 
         # Each should be counted separately (grouping is handled by LLM later)
         assert counts["1/2"] == 1
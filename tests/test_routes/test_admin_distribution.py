@@ -13,174 +13,115 @@ This test file covers:
 - Distribution only available for current question
 """
 
+import pytest
 from fastapi.testclient import TestClient
 
-from app.auth import create_admin_cookie, create_pid_cookie
+from app.auth import create_pid_cookie
 from app.config import Settings
 from app.models import QuestionType
+from app.redis_client import RedisClient
+
+# Students answering in the distribution tests, zipped with each test's answers
+PIDS = ("A12345678", "A12345679", "A12345680", "A12345681")
 
 
 class TestDistributionEndpoint:
     """Test cases for distribution display endpoint"""
 
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_mcq(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """Test getting distribution for MCQ question"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session and create MCQ question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
-        qid = redis_client_wrapper.create_question(
+        # Create MCQ question
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C", "D"]
         )
 
         # Submit some answers
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345679", "B")
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345680", "A")
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345681", "C")
+        redis_wrapper.submit_answers(
+            "test-course", qid, zip(PIDS, ["A", "B", "A", "C"], strict=True)
+        )
 
         # Get distribution
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         assert response.status_code == 200
-        data = response.json()
-
-        assert data["question_id"] == qid
-        assert data["type"] == "mcq"
-        assert data["total"] == 4
-        assert data["counts"] == {"A": 2, "B": 1, "C": 1, "D": 0}
-        assert data["percentages"]["A"] == 50.0
-        assert data["percentages"]["B"] == 25.0
-        assert data["percentages"]["C"] == 25.0
-        assert data["percentages"]["D"] == 0.0
-
+        assert response.json() == {
+            "question_id": qid,
+            "type": "mcq",
+            "total": 4,
+            "counts": {"A": 2, "B": 1, "C": 1, "D": 0},
+            "percentages": {"A": 50.0, "B": 25.0, "C": 25.0, "D": 0.0},
+            "options": ["A", "B", "C", "D"],
+        }
+
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_tf(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """Test getting distribution for True/False question"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session and create T/F question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
-        qid = redis_client_wrapper.create_question("test-course", QuestionType.TF)
+        # Create T/F question
+        qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
         # Submit answers
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", True)
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345679", False)
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345680", True)
+        redis_wrapper.submit_answers(
+            "test-course", qid, zip(PIDS[:3], [True, False, True], strict=True)
+        )
 
         # Get distribution
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         assert response.status_code == 200
-        data = response.json()
-
-        assert data["question_id"] == qid
-        assert data["type"] == "tf"
-        assert data["total"] == 3
         # Counts should have "true" and "false" as string keys
-        assert data["counts"]["true"] == 2
-        assert data["counts"]["false"] == 1
-        assert abs(data["percentages"]["true"] - 66.67) < 0.01
-        assert abs(data["percentages"]["false"] - 33.33) < 0.01
-
+        assert response.json() == {
+            "question_id": qid,
+            "type": "tf",
+            "total": 3,
+            "counts": {"true": 2, "false": 1},
+            "percentages": pytest.approx({"true": 66.67, "false": 33.33}, abs=0.01),
+            "options": None,
+        }
+
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_numeric(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """Test getting distribution for Numeric question"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session and create Numeric question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
-        qid = redis_client_wrapper.create_question("test-course", QuestionType.NUMERIC)
+        # Create Numeric question
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
         # Submit numeric answers
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", 42)
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345679", 3.14)
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345680", 42)
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345681", 100)
+        redis_wrapper.submit_answers(
+            "test-course", qid, zip(PIDS, [42, 3.14, 42, 100], strict=True)
+        )
 
         # Get distribution
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         assert response.status_code == 200
-        data = response.json()
-
-        assert data["question_id"] == qid
-        assert data["type"] == "numeric"
-        assert data["total"] == 4
         # Counts should have numeric values as string keys
-        assert data["counts"]["42"] == 2
-        assert data["counts"]["3.14"] == 1
-        assert data["counts"]["100"] == 1
-        assert data["percentages"]["42"] == 50.0
-        assert data["percentages"]["3.14"] == 25.0
-        assert data["percentages"]["100"] == 25.0
-
+        assert response.json() == {
+            "question_id": qid,
+            "type": "numeric",
+            "total": 4,
+            "counts": {"42": 2, "3.14": 1, "100": 1},
+            "percentages": {"42": 50.0, "3.14": 25.0, "100": 25.0},
+            "options": None,
+        }
+
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_empty(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """Test getting distribution when no responses yet"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session and create MCQ question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
-        qid = redis_client_wrapper.create_question(
+        # Create MCQ question
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C"]
         )
 
         # Get distribution without any answers
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         assert response.status_code == 200
         data = response.json()
@@ -191,28 +132,13 @@ class TestDistributionEndpoint:
         assert data["counts"] == {"A": 0, "B": 0, "C": 0}
         assert data["percentages"] == {"A": 0.0, "B": 0.0, "C": 0.0}
 
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_no_active_question(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient
     ) -> None:
         """Test getting distribution when no active question"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session but don't create any question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
         # Get distribution
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         assert response.status_code == 404
         data = response.json()
@@ -220,69 +146,40 @@ class TestDistributionEndpoint:
         assert "no active question" in data["detail"].lower()
 
     def test_get_distribution_unauthorized(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings
     ) -> None:
         """Test getting distribution without admin auth"""
-        from app.redis_client import RedisClient
-
-        # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-        redis_client_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
-
-        # Try to get distribution without admin cookie
+        # Auth is checked before Redis is read, so no question is needed
+        # (without the check the route would answer 404, not 403)
         response = client.get("/test-course/admin/distribution")
 
         assert response.status_code == 403
 
     def test_get_distribution_invalid_admin_cookie(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings
     ) -> None:
         """Test getting distribution with invalid admin cookie"""
-        from app.redis_client import RedisClient
-
-        # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-        redis_client_wrapper.create_question("test-course", QuestionType.MCQ, ["A", "B"])
-
         # Try with invalid cookie
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": "invalid-cookie"},
-        )
+        client.cookies.set("admin_session", "invalid-cookie")
+        response = client.get("/test-course/admin/distribution")
 
         assert response.status_code == 403
 
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_counts_update_on_answer(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """Test that distribution updates when student changes answer"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session and create MCQ question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
-        qid = redis_client_wrapper.create_question(
+        # Create MCQ question
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C"]
         )
 
         # Submit initial answer
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Get initial distribution
-        response1 = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response1 = admin_client.get("/test-course/admin/distribution")
 
         assert response1.status_code == 200
         data1 = response1.json()
@@ -290,13 +187,10 @@ class TestDistributionEndpoint:
         assert data1["counts"]["B"] == 0
 
         # Change answer
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "B")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "B")
 
         # Get updated distribution
-        response2 = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response2 = admin_client.get("/test-course/admin/distribution")
 
         assert response2.status_code == 200
         data2 = response2.json()
@@ -309,60 +203,34 @@ class TestDistributionEndpoint:
         """Test getting distribution for non-existent course"""
         # Try with a course that doesn't exist
         # Note: Auth fails first (403) before course check (404)
-        response = client.get(
-            "/nonexistent-course/admin/distribution",
-            cookies={"admin_session": "some-cookie"},
-        )
+        client.cookies.set("admin_session", "some-cookie")
+        response = client.get("/nonexistent-course/admin/distribution")
 
         assert response.status_code == 403
 
     def test_get_distribution_session_not_started(
-        self, client: TestClient, test_settings: Settings
+        self, admin_client: TestClient
     ) -> None:
         """Test getting distribution when session not started"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Don't start session, just try to get distribution
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         # Should return 404 since there's no active question (session not started)
         assert response.status_code == 404
 
+    @pytest.mark.usefixtures("live_session")
     def test_get_distribution_with_options(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """Test that distribution includes options for MCQ"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        # Start session and create MCQ question with custom options
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
-
+        # Create MCQ question with custom options
         options = ["Option A", "Option B", "Option C", "Option D"]
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options
         )
 
         # Get distribution
-        response = client.get(
-            "/test-course/admin/distribution",
-            cookies={"admin_session": admin_cookie},
-        )
+        response = admin_client.get("/test-course/admin/distribution")
 
         assert response.status_code == 200
         data = response.json()
@@ -14,35 +14,24 @@ import time
 
 from fastapi.testclient import TestClient
 
-from app.auth import create_admin_cookie
-from app.config import Settings
 from app.models import QuestionType
+from app.redis_client import RedisClient
 
 
 class TestSessionArchiving:
     """Test cases for session archiving on stop"""
 
     def test_stop_session_creates_archive(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that stopping a session creates an archive"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Stop session
         response = client.post(
@@ -53,7 +42,7 @@ class TestSessionArchiving:
         assert response.status_code == 200
 
         # Verify archive was created
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
         assert "session_id" in archives[0]
         assert "started_at" in archives[0]
@@ -62,30 +51,20 @@ class TestSessionArchiving:
         assert archives[0]["question_count"] == 1
 
     def test_stop_session_archive_contains_full_data(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that archived session contains all question/response data"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create multiple questions
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid1 = redis_client_wrapper.create_question(
+        qid1 = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
-        redis_client_wrapper.submit_answer("test-course", qid1, "A12345679", "B")
+        redis_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid1, "A12345679", "B")
 
-        qid2 = redis_client_wrapper.create_question("test-course", QuestionType.TF)
-        redis_client_wrapper.submit_answer("test-course", qid2, "A12345678", True)
+        qid2 = redis_wrapper.create_question("test-course", QuestionType.TF)
+        redis_wrapper.submit_answer("test-course", qid2, "A12345678", True)
 
         # Stop session
         client.post(
@@ -94,10 +73,10 @@ class TestSessionArchiving:
         )
 
         # Get archived session
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         session_id = archives[0]["session_id"]
 
-        archive_data = redis_client_wrapper.get_archived_session(
+        archive_data = redis_wrapper.get_archived_session(
             "test-course", session_id
         )
 
@@ -117,30 +96,20 @@ class TestSessionArchiving:
         assert "A12345679" in mcq["responses"]
 
     def test_stop_session_clears_current_data(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that stopping session clears current session data"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Verify data exists before stop
-        assert redis_client_wrapper.get_question_meta("test-course", qid) is not None
-        assert len(redis_client_wrapper.get_all_question_ids("test-course")) == 1
+        assert redis_wrapper.get_question_meta("test-course", qid) is not None
+        assert len(redis_wrapper.get_all_question_ids("test-course")) == 1
 
         # Stop session
         client.post(
@@ -149,26 +118,16 @@ class TestSessionArchiving:
         )
 
         # Verify current data is cleared
-        assert not redis_client_wrapper.is_session_live("test-course")
-        assert redis_client_wrapper.get_current_question("test-course") is None
-        assert len(redis_client_wrapper.get_all_question_ids("test-course")) == 0
+        assert not redis_wrapper.is_session_live("test-course")
+        assert redis_wrapper.get_current_question("test-course") is None
+        assert len(redis_wrapper.get_all_question_ids("test-course")) == 0
 
     def test_stop_empty_session_creates_empty_archive(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that stopping session with no questions creates empty archive"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start and stop session without creating questions
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         client.post(
             "/test-course/admin/session/stop",
@@ -176,7 +135,7 @@ class TestSessionArchiving:
         )
 
         # Verify empty archive was created
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
         assert archives[0]["question_count"] == 0
 
@@ -185,26 +144,16 @@ class TestSessionCleanup:
     """Test cases for session cleanup on start"""
 
     def test_start_session_clears_old_data(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that starting a new session clears old session data"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
 
         # First session
-        redis_client_wrapper.start_session("test-course")
-        qid1 = redis_client_wrapper.create_question(
+        redis_wrapper.start_session("test-course")
+        qid1 = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
 
         # Stop session (archives data)
         client.post(
@@ -213,7 +162,7 @@ class TestSessionCleanup:
         )
 
         # Verify archive exists
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
 
         # Start new session
@@ -225,35 +174,25 @@ class TestSessionCleanup:
         assert response.status_code == 200
 
         # Verify current session data is clean
-        assert redis_client_wrapper.is_session_live("test-course")
-        assert redis_client_wrapper.get_current_question("test-course") is None
-        assert len(redis_client_wrapper.get_all_question_ids("test-course")) == 0
+        assert redis_wrapper.is_session_live("test-course")
+        assert redis_wrapper.get_current_question("test-course") is None
+        assert len(redis_wrapper.get_all_question_ids("test-course")) == 0
 
         # Verify archive still exists
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
 
     def test_multiple_session_cycles(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test multiple session start/stop cycles create separate archives"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
 
         # Session 1
-        redis_client_wrapper.start_session("test-course")
-        qid1 = redis_client_wrapper.create_question(
+        redis_wrapper.start_session("test-course")
+        qid1 = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
         client.post(
             "/test-course/admin/session/stop",
             cookies={"admin_session": admin_cookie},
@@ -266,24 +205,24 @@ class TestSessionCleanup:
             "/test-course/admin/session/start",
             cookies={"admin_session": admin_cookie},
         )
-        qid2 = redis_client_wrapper.create_question(
+        qid2 = redis_wrapper.create_question(
             "test-course", QuestionType.TF
         )
-        redis_client_wrapper.submit_answer("test-course", qid2, "A12345679", True)
+        redis_wrapper.submit_answer("test-course", qid2, "A12345679", True)
         client.post(
             "/test-course/admin/session/stop",
             cookies={"admin_session": admin_cookie},
         )
 
         # Verify two separate archives exist
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 2
 
         # Verify each archive has correct data
-        archive1 = redis_client_wrapper.get_archived_session(
+        archive1 = redis_wrapper.get_archived_session(
             "test-course", archives[0]["session_id"]
         )
-        archive2 = redis_client_wrapper.get_archived_session(
+        archive2 = redis_wrapper.get_archived_session(
             "test-course", archives[1]["session_id"]
         )
 
@@ -300,27 +239,17 @@ class TestArchiveRoutes:
     """Test cases for archive listing and download routes"""
 
     def test_archives_page_lists_sessions(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that archives page lists archived sessions"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
 
         # Create two archived sessions
         for i in range(2):
-            redis_client_wrapper.start_session("test-course")
-            qid = redis_client_wrapper.create_question(
+            redis_wrapper.start_session("test-course")
+            qid = redis_wrapper.create_question(
                 "test-course", QuestionType.MCQ, ["A", "B"]
             )
-            redis_client_wrapper.submit_answer("test-course", qid, f"A1234567{i}", "A")
+            redis_wrapper.submit_answer("test-course", qid, f"A1234567{i}", "A")
             client.post(
                 "/test-course/admin/session/stop",
                 cookies={"admin_session": admin_cookie},
@@ -338,31 +267,21 @@ class TestArchiveRoutes:
 
         # Check that both archives are listed
         html = response.text
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         for archive in archives:
             assert archive["session_id"] in html
 
     def test_archive_download(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test downloading an archived session"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
 
         # Create archived session
-        redis_client_wrapper.start_session("test-course")
-        qid = redis_client_wrapper.create_question(
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "B")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "B")
 
         client.post(
             "/test-course/admin/session/stop",
@@ -370,7 +289,7 @@ class TestArchiveRoutes:
         )
 
         # Get session_id
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         session_id = archives[0]["session_id"]
 
         # Download archive
@@ -389,17 +308,37 @@ class TestArchiveRoutes:
         assert len(data["questions"]) == 1
         assert data["questions"][0]["type"] == "mcq"
 
-    def test_archives_page_no_archives(
-        self, client: TestClient, test_settings: Settings
+        # The download is the stored archive, unchanged
+        assert data == redis_wrapper.get_archived_session("test-course", session_id)
+
+    def test_archive_download_gzipped(
+        self, admin_client: TestClient, redis_wrapper: RedisClient
     ) -> None:
-        """Test archives page when no archives exist"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
+        """Test that large archive downloads are gzipped when the client accepts it"""
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question(
+            "test-course", QuestionType.MCQ, ["A", "B", "C"]
+        )
+        redis_wrapper.submit_answers(
+            "test-course", qid, ((f"A{n:08d}", "A") for n in range(50))
+        )
+
+        admin_client.post("/test-course/admin/session/stop")
+        session_id = redis_wrapper.get_archived_sessions("test-course")[0]["session_id"]
 
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
+        response = admin_client.get(
+            f"/test-course/admin/archives/{session_id}",
+            headers={"Accept-Encoding": "gzip"},
         )
 
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["questions"][0]["responses"]) == 50
+
+    def test_archives_page_no_archives(
+        self, client: TestClient, admin_cookie: str
+    ) -> None:
+        """Test archives page when no archives exist"""
         response = client.get(
             "/test-course/admin/archives",
             cookies={"admin_session": admin_cookie},
@@ -409,16 +348,9 @@ class TestArchiveRoutes:
         assert "No archived sessions" in response.text
 
     def test_archive_download_not_found(
-        self, client: TestClient, test_settings: Settings
+        self, client: TestClient, admin_cookie: str
     ) -> None:
         """Test downloading non-existent archive returns 404"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         response = client.get(
             "/test-course/admin/archives/nonexistent-id",
             cookies={"admin_session": admin_cookie},
@@ -441,23 +373,13 @@ class TestArchiveTTL:
     """Test cases for archive expiration"""
 
     def test_archive_has_ttl(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that archived sessions have TTL set"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
 
         # Create archived session
-        redis_client_wrapper.start_session("test-course")
-        qid = redis_client_wrapper.create_question(
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
 
@@ -467,33 +389,23 @@ class TestArchiveTTL:
         )
 
         # Get archive key and check TTL
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         session_id = archives[0]["session_id"]
 
         archive_key = f"course:test-course:archive:{session_id}"
-        ttl = redis_client.ttl(archive_key)
+        ttl = redis_wrapper.redis.ttl(archive_key)
 
         # Should have TTL set (24 hours = 86400 seconds)
         assert 86390 < ttl <= 86400
 
     def test_old_archives_expire(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that old archives expire and are not listed"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
 
         # Create archived session
-        redis_client_wrapper.start_session("test-course")
-        qid = redis_client_wrapper.create_question(
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
 
@@ -503,17 +415,17 @@ class TestArchiveTTL:
         )
 
         # Verify archive exists
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
         session_id = archives[0]["session_id"]
 
         # Manually expire the archive (set TTL to 1 second)
         archive_key = f"course:test-course:archive:{session_id}"
-        redis_client.expire(archive_key, 1)
+        redis_wrapper.redis.expire(archive_key, 1)
 
         # Wait for expiration
         time.sleep(1.5)
 
         # Verify archive no longer exists
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 0
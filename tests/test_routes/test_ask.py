@@ -19,26 +19,21 @@ from fastapi.testclient import TestClient
 from app.auth import create_pid_cookie
 from app.config import Settings
 from app.models import EventType
+from app.redis_client import RedisClient
 
 
 class TestAskSubmission:
     """Test cases for student question submission"""
 
     def test_submit_question_success(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test successful question submission"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         # Create PID cookie
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
         # Start session first
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit question
         response = client.post(
@@ -53,18 +48,12 @@ class TestAskSubmission:
         assert "question_id" in data
 
     def test_submit_question_strips_pid(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that PIDs are stripped from question text"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit question with PID embedded
         question_text = "My PID is A12345678 and I have a question about A98765432"
@@ -79,7 +68,7 @@ class TestAskSubmission:
         question_id = data["question_id"]
 
         # Verify PID was stripped in stored question
-        stored_question = redis_client_wrapper.get_question("test-course", question_id)
+        stored_question = redis_wrapper.get_question("test-course", question_id)
         assert stored_question is not None
         # PIDs should be replaced with [PID]
         assert "A12345678" not in stored_question["question"]
@@ -87,18 +76,12 @@ class TestAskSubmission:
         assert "[PID]" in stored_question["question"]
 
     def test_submit_question_too_long(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that questions longer than 1000 chars are rejected"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit question that's too long (1001 chars)
         question_text = "x" * 1001
@@ -113,18 +96,12 @@ class TestAskSubmission:
         assert "too long" in data["detail"].lower() or "1000" in data["detail"]
 
     def test_submit_question_exactly_1000_chars(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that questions with exactly 1000 chars are accepted"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit question that's exactly 1000 chars
         question_text = "x" * 1000
@@ -137,18 +114,12 @@ class TestAskSubmission:
         assert response.status_code == 200
 
     def test_submit_question_rate_limit(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test rate limiting: 1 question per 10 seconds per PID"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit first question
         response1 = client.post(
@@ -170,19 +141,13 @@ class TestAskSubmission:
         assert data["retry_after"] > 0
 
     def test_submit_question_rate_limit_different_pids(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that rate limiting is per-PID (different PIDs don't interfere)"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie1 = create_pid_cookie("A12345678", test_settings.secret_key)
         pid_cookie2 = create_pid_cookie("A87654321", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit question from PID 1
         response1 = client.post(
@@ -201,18 +166,12 @@ class TestAskSubmission:
         assert response2.status_code == 200
 
     def test_submit_question_rate_limit_resets(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that rate limit resets after 10 seconds"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit first question
         response1 = client.post(
@@ -263,18 +222,12 @@ class TestAskSubmission:
         assert "session" in data["detail"].lower() or "not active" in data["detail"].lower()
 
     def test_submit_question_stores_timestamp(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that question includes timestamp"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         response = client.post(
             "/test-course/ask",
@@ -287,7 +240,7 @@ class TestAskSubmission:
         question_id = data["question_id"]
 
         # Verify timestamp is stored
-        question = redis_client_wrapper.get_question("test-course", question_id)
+        question = redis_wrapper.get_question("test-course", question_id)
         assert question is not None
         assert "timestamp" in question
         # Timestamp should be ISO format
@@ -298,21 +251,10 @@ class TestAdminQuestionView:
     """Test cases for admin question viewing"""
 
     def test_get_questions_empty(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test getting questions when there are none"""
-        from app.redis_client import RedisClient
-        from app.auth import create_admin_cookie
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         response = client.get(
             "/test-course/admin/questions",
@@ -325,21 +267,14 @@ class TestAdminQuestionView:
         assert len(data) == 0
 
     def test_get_questions_with_submissions(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self,
+        client: TestClient,
+        test_settings: Settings,
+        admin_cookie: str,
+        redis_wrapper: RedisClient,
     ) -> None:
         """Test getting submitted questions"""
-        from app.redis_client import RedisClient
-        from app.auth import create_admin_cookie
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit three questions from different PIDs (to avoid rate limiting)
         for i in range(3):
@@ -381,18 +316,12 @@ class TestAdminQuestionView:
         assert response.status_code == 403
 
     def test_question_ttl(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that questions have TTL set"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # Submit question
         response = client.post(
@@ -407,7 +336,7 @@ class TestAdminQuestionView:
 
         # Check TTL on question key
         question_key = f"course:test-course:question:{question_id}"
-        ttl = redis_client.ttl(question_key)
+        ttl = redis_wrapper.redis.ttl(question_key)
 
         # Should have TTL set (30 minutes = 1800 seconds)
         assert 1700 < ttl <= 1800
@@ -18,38 +18,28 @@ import time
 
 from fastapi.testclient import TestClient
 
-from app.auth import create_admin_cookie
 from app.config import Settings
 from app.models import QuestionType
+from app.redis_client import RedisClient
 
 
 class TestExportEndpoint:
     """Test cases for export endpoint"""
 
     def test_export_basic_format(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test basic export format with one question"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C", "D"]
         )
 
         # Submit some answers
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345679", "B")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345679", "B")
 
         # Export
         response = client.get(
@@ -72,36 +62,26 @@ class TestExportEndpoint:
         assert len(question_data["responses"]) == 2
 
     def test_export_all_questions(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that all questions are included in export"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create multiple questions
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid1 = redis_client_wrapper.create_question(
+        qid1 = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
-        redis_client_wrapper.stop_question("test-course", qid1)
+        redis_wrapper.submit_answer("test-course", qid1, "A12345678", "A")
+        redis_wrapper.stop_question("test-course", qid1)
 
-        qid2 = redis_client_wrapper.create_question("test-course", QuestionType.TF)
-        redis_client_wrapper.submit_answer("test-course", qid2, "A12345678", True)
-        redis_client_wrapper.stop_question("test-course", qid2)
+        qid2 = redis_wrapper.create_question("test-course", QuestionType.TF)
+        redis_wrapper.submit_answer("test-course", qid2, "A12345678", True)
+        redis_wrapper.stop_question("test-course", qid2)
 
-        qid3 = redis_client_wrapper.create_question(
+        qid3 = redis_wrapper.create_question(
             "test-course", QuestionType.NUMERIC
         )
-        redis_client_wrapper.submit_answer("test-course", qid3, "A12345678", 42)
+        redis_wrapper.submit_answer("test-course", qid3, "A12345678", 42)
 
         # Export
         response = client.get(
@@ -119,26 +99,16 @@ class TestExportEndpoint:
         assert qid3 in question_ids
 
     def test_export_response_format(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test response format includes timestamp and answer"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Export
         response = client.get(
@@ -163,32 +133,22 @@ class TestExportEndpoint:
         assert timestamp.endswith("Z") or "+" in timestamp or "-" in timestamp[-6:]
 
     def test_export_latest_answer_only(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that only the latest answer per student is included"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C"]
         )
 
         # Student changes answer multiple times
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
         time.sleep(0.01)  # Ensure different timestamps
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "B")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "B")
         time.sleep(0.01)
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "C")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "C")
 
         # Export
         response = client.get(
@@ -205,23 +165,13 @@ class TestExportEndpoint:
         assert responses["A12345678"]["response"] == "C"
 
     def test_export_no_responses(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test export with question but no responses"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question without answers
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
 
@@ -239,16 +189,9 @@ class TestExportEndpoint:
         assert data[0]["responses"] == {}
 
     def test_export_no_session(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_client
     ) -> None:
         """Test export when no session exists"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Export without starting session
         response = client.get(
             "/test-course/admin/export",
@@ -277,37 +220,27 @@ class TestExportEndpoint:
         assert response.status_code == 403
 
     def test_export_different_question_types(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test export handles all question types correctly"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create different question types
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
         # MCQ
-        qid1 = redis_client_wrapper.create_question(
+        qid1 = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B", "C"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid1, "A12345678", "B")
+        redis_wrapper.submit_answer("test-course", qid1, "A12345678", "B")
 
         # T/F
-        qid2 = redis_client_wrapper.create_question("test-course", QuestionType.TF)
-        redis_client_wrapper.submit_answer("test-course", qid2, "A12345679", False)
+        qid2 = redis_wrapper.create_question("test-course", QuestionType.TF)
+        redis_wrapper.submit_answer("test-course", qid2, "A12345679", False)
 
         # Numeric
-        qid3 = redis_client_wrapper.create_question(
+        qid3 = redis_wrapper.create_question(
             "test-course", QuestionType.NUMERIC
         )
-        redis_client_wrapper.submit_answer("test-course", qid3, "A12345680", 3.14)
+        redis_wrapper.submit_answer("test-course", qid3, "A12345680", 3.14)
 
         # Export
         response = client.get(
@@ -340,40 +273,30 @@ class TestSessionTTL:
     """Test cases for session archiving on stop"""
 
     def test_session_stop_applies_ttl(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that stopping session archives data and clears current session"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session and create question
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Get keys before stopping
-        session_key = redis_client_wrapper.session_key("test-course")
-        current_qid_key = redis_client_wrapper.current_qid_key("test-course")
-        question_meta_key = redis_client_wrapper.question_meta_key("test-course", qid)
-        responses_key = redis_client_wrapper.question_responses_key("test-course", qid)
-        counts_key = redis_client_wrapper.question_counts_key("test-course", qid)
+        session_key = redis_wrapper.session_key("test-course")
+        current_qid_key = redis_wrapper.current_qid_key("test-course")
+        question_meta_key = redis_wrapper.question_meta_key("test-course", qid)
+        responses_key = redis_wrapper.question_responses_key("test-course", qid)
+        counts_key = redis_wrapper.question_counts_key("test-course", qid)
 
         # Verify keys exist and have no TTL (-1)
-        assert redis_client.ttl(session_key) == -1
-        assert redis_client.ttl(current_qid_key) == -1
-        assert redis_client.ttl(question_meta_key) == -1
-        assert redis_client.ttl(responses_key) == -1
-        assert redis_client.ttl(counts_key) == -1
+        assert redis_wrapper.redis.ttl(session_key) == -1
+        assert redis_wrapper.redis.ttl(current_qid_key) == -1
+        assert redis_wrapper.redis.ttl(question_meta_key) == -1
+        assert redis_wrapper.redis.ttl(responses_key) == -1
+        assert redis_wrapper.redis.ttl(counts_key) == -1
 
         # Stop session
         response = client.post(
@@ -384,40 +307,30 @@ class TestSessionTTL:
         assert response.status_code == 200
 
         # Verify current session keys are deleted (TTL = -2 means key doesn't exist)
-        assert redis_client.ttl(session_key) == -2
-        assert redis_client.ttl(current_qid_key) == -2
-        assert redis_client.ttl(question_meta_key) == -2
-        assert redis_client.ttl(responses_key) == -2
-        assert redis_client.ttl(counts_key) == -2
+        assert redis_wrapper.redis.ttl(session_key) == -2
+        assert redis_wrapper.redis.ttl(current_qid_key) == -2
+        assert redis_wrapper.redis.ttl(question_meta_key) == -2
+        assert redis_wrapper.redis.ttl(responses_key) == -2
+        assert redis_wrapper.redis.ttl(counts_key) == -2
 
         # Verify archive was created with TTL
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
         session_id = archives[0]["session_id"]
-        archive_key = redis_client_wrapper.archive_key("test-course", session_id)
-        assert 86390 < redis_client.ttl(archive_key) <= 86400
+        archive_key = redis_wrapper.archive_key("test-course", session_id)
+        assert 86390 < redis_wrapper.redis.ttl(archive_key) <= 86400
 
     def test_export_available_after_session_stop(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, admin_cookie: str, redis_wrapper: RedisClient
     ) -> None:
         """Test that archived data is available after session stops"""
-        from app.redis_client import RedisClient
-
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        admin_cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         # Start session, create question, submit answer
-        redis_client_wrapper = RedisClient(redis_client)
-        redis_client_wrapper.start_session("test-course")
+        redis_wrapper.start_session("test-course")
 
-        qid = redis_client_wrapper.create_question(
+        qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, ["A", "B"]
         )
-        redis_client_wrapper.submit_answer("test-course", qid, "A12345678", "A")
+        redis_wrapper.submit_answer("test-course", qid, "A12345678", "A")
 
         # Stop session
         client.post(
@@ -436,7 +349,7 @@ class TestSessionTTL:
         assert len(data) == 0  # Current session is cleared
 
         # But archived session should be available
-        archives = redis_client_wrapper.get_archived_sessions("test-course")
+        archives = redis_wrapper.get_archived_sessions("test-course")
         assert len(archives) == 1
         session_id = archives[0]["session_id"]
 
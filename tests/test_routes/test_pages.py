@@ -14,8 +14,8 @@ This test file covers:
 
 from fastapi.testclient import TestClient
 
-from app.auth import create_admin_cookie, create_pid_cookie
-from app.config import Settings
+from app.auth import create_pid_cookie
+from app.config import CourseConfig, Settings
 
 
 class TestAdminLoginPage:
@@ -39,19 +39,12 @@ class TestAdminLoginPage:
         assert response.status_code == 404
 
     def test_admin_login_page_already_authenticated(
-        self, client: TestClient, test_settings: Settings
+        self, client: TestClient, admin_cookie: str
     ) -> None:
         """Test that authenticated admin sees dashboard, not login"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         response = client.get(
             "/test-course/admin",
-            cookies={"admin_session": cookie},
+            cookies={"admin_session": admin_cookie},
         )
 
         assert response.status_code == 200
@@ -63,15 +56,12 @@ class TestAdminLoginPost:
     """Test cases for admin login POST"""
 
     def test_admin_login_valid_secret(
-        self, client: TestClient, test_settings: Settings
+        self, client: TestClient, test_settings: Settings, test_course: CourseConfig
     ) -> None:
         """Test admin login with valid secret redirects to dashboard"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
         response = client.post(
             "/test-course/admin/login",
-            data={"secret": course.secret},
+            data={"secret": test_course.secret},
             follow_redirects=False,
         )
 
@@ -132,19 +122,12 @@ class TestAdminDashboard:
             assert b"secret" in response.content.lower()
 
     def test_admin_dashboard_with_valid_auth(
-        self, client: TestClient, test_settings: Settings
+        self, client: TestClient, admin_cookie: str
     ) -> None:
         """Test that dashboard loads with valid auth"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         response = client.get(
             "/test-course/admin",
-            cookies={"admin_session": cookie},
+            cookies={"admin_session": admin_cookie},
         )
 
         assert response.status_code == 200
@@ -164,19 +147,12 @@ class TestAdminDashboard:
         assert response.status_code in [200, 303]
 
     def test_admin_dashboard_wrong_course(
-        self, client: TestClient, test_settings: Settings
+        self, client: TestClient, admin_cookie: str
     ) -> None:
         """Test that admin for one course can't access another"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         response = client.get(
             "/another-course/admin",
-            cookies={"admin_session": cookie},
+            cookies={"admin_session": admin_cookie},
             follow_redirects=False,
         )
 
@@ -371,19 +347,12 @@ class TestTemplateRendering:
     """Test cases for template rendering"""
 
     def test_admin_page_contains_htmx(
-        self, client: TestClient, test_settings: Settings
+        self, client: TestClient, admin_cookie: str
     ) -> None:
         """Test that admin page includes HTMX"""
-        course = test_settings.get_course("test-course")
-        assert course is not None
-
-        cookie = create_admin_cookie(
-            "test-course", course.secret, test_settings.secret_key
-        )
-
         response = client.get(
             "/test-course/admin",
-            cookies={"admin_session": cookie},
+            cookies={"admin_session": admin_cookie},
         )
 
         assert response.status_code == 200
@@ -31,11 +31,10 @@ class TestMCQAnswerSubmission:
     """Test cases for MCQ answer submission"""
 
     def test_submit_mcq_answer(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting an MCQ answer"""
         # Setup: create session and question
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B", "C", "D"]
@@ -65,11 +64,10 @@ class TestMCQAnswerSubmission:
         assert counts["A"] == 1
 
     def test_submit_multiple_mcq_answers(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test multiple students submitting MCQ answers"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B", "C", "D"]
@@ -101,11 +99,10 @@ class TestMCQAnswerSubmission:
         assert counts.get("D", 0) == 0
 
     def test_change_mcq_answer(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test changing an MCQ answer (A to B)"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B", "C", "D"]
@@ -143,11 +140,10 @@ class TestMCQAnswerSubmission:
         assert stored["resp"] == "B"
 
     def test_mcq_invalid_option(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting invalid MCQ option"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B", "C", "D"]
@@ -170,11 +166,10 @@ class TestTrueFalseAnswerSubmission:
     """Test cases for True/False answer submission"""
 
     def test_submit_tf_answer_true(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting True answer"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
@@ -198,11 +193,10 @@ class TestTrueFalseAnswerSubmission:
         assert counts["true"] == 1
 
     def test_submit_tf_answer_false(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting False answer"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
@@ -226,11 +220,10 @@ class TestTrueFalseAnswerSubmission:
         assert counts["false"] == 1
 
     def test_change_tf_answer(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test changing T/F answer"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
@@ -262,11 +255,10 @@ class TestNumericAnswerSubmission:
     """Test cases for numeric answer submission"""
 
     def test_submit_numeric_answer_int(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting numeric answer (integer)"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
@@ -286,11 +278,10 @@ class TestNumericAnswerSubmission:
         assert stored["resp"] == 42
 
     def test_submit_numeric_answer_float(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting numeric answer (float)"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
@@ -310,11 +301,10 @@ class TestNumericAnswerSubmission:
         assert stored["resp"] == 3.14
 
     def test_submit_numeric_answer_string(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting numeric answer as string"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
 
@@ -333,16 +323,68 @@ class TestNumericAnswerSubmission:
         stored = redis_wrapper.get_response("test-course", qid, "A12345678")
         assert stored["resp"] == "1/2"
 
+    def test_numeric_answer_out_of_range_rejected(
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
+    ) -> None:
+        """Test that integers beyond 64 bits are rejected instead of failing to store"""
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
+
+        pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
+
+        response = client.post(
+            "/test-course/answer",
+            cookies={"student_session": pid_cookie},
+            data={"question_id": qid, "response": "123456789012345678901234567890"},
+        )
+
+        assert response.status_code == 400
+        assert redis_wrapper.get_response("test-course", qid, "A12345678") is None
+
+    def test_numeric_answer_nan_rejected(
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
+    ) -> None:
+        """Test that NaN is rejected, so a later answer leaves no stale count"""
+        redis_wrapper.start_session("test-course")
+        qid = redis_wrapper.create_question("test-course", QuestionType.NUMERIC)
+
+        pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
+
+        # NaN is only valid in Python's lenient JSON, so send the body raw
+        response = client.post(
+            "/test-course/answer",
+            cookies={"student_session": pid_cookie},
+            content=f'{{"question_id": "{qid}", "response": NaN}}',
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
+
+        # Infinity from form data is rejected the same way
+        response = client.post(
+            "/test-course/answer",
+            cookies={"student_session": pid_cookie},
+            data={"question_id": qid, "response": "1.0e999"},
+        )
+        assert response.status_code == 400
+
+        response = client.post(
+            "/test-course/answer",
+            cookies={"student_session": pid_cookie},
+            data={"question_id": qid, "response": 5},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["counts"] == {"5": 1}
+
 
 class TestAnswerValidation:
     """Test cases for answer validation"""
 
     def test_answer_without_active_question(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting answer when no question is active"""
         # Setup: session but no question
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
 
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
@@ -355,15 +397,14 @@ class TestAnswerValidation:
         )
 
         assert response.status_code == 400
-        assert "no active question" in response.json()["detail"].lower() or \
-               "not found" in response.json()["detail"].lower()
+        detail = response.json()["detail"].lower()
+        assert "no active question" in detail or "not found" in detail
 
     def test_answer_to_stopped_question(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting answer to a stopped question"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -382,15 +423,14 @@ class TestAnswerValidation:
         )
 
         assert response.status_code == 400
-        assert "not active" in response.json()["detail"].lower() or \
-               "ended" in response.json()["detail"].lower()
+        detail = response.json()["detail"].lower()
+        assert "not active" in detail or "ended" in detail
 
     def test_answer_without_pid_cookie(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting answer without PID cookie"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -405,11 +445,10 @@ class TestAnswerValidation:
         assert response.status_code in [401, 403]
 
     def test_answer_type_mismatch_mcq_with_boolean(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting boolean to MCQ question"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -429,11 +468,10 @@ class TestAnswerValidation:
         assert any(word in detail_lower for word in ["type", "invalid", "require", "string"])
 
     def test_answer_type_mismatch_tf_with_string(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting string to T/F question"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question("test-course", QuestionType.TF)
 
@@ -453,13 +491,12 @@ class TestTimestampUpdates:
     """Test cases for timestamp tracking"""
 
     def test_timestamp_recorded(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that timestamp is recorded with answer"""
         from datetime import datetime, UTC
 
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -486,13 +523,12 @@ class TestTimestampUpdates:
         assert before_time <= ts <= after_time
 
     def test_timestamp_updates_on_change(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test that timestamp updates when answer changes"""
         from datetime import datetime
 
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -531,11 +567,10 @@ class TestConcurrentAnswers:
     """Test cases for concurrent answer submissions"""
 
     def test_concurrent_different_students(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test concurrent submissions from different students"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B", "C"]
@@ -575,11 +610,10 @@ class TestConcurrentAnswers:
         assert counts["C"] == 1
 
     def test_concurrent_same_student_changes(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test concurrent answer changes from same student"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B", "C", "D"]
@@ -622,11 +656,10 @@ class TestEdgeCases:
     """Test edge cases and error conditions"""
 
     def test_empty_response(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting empty response"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -644,11 +677,10 @@ class TestEdgeCases:
         assert response.status_code in [400, 422]  # 422 for Pydantic validation error
 
     def test_null_response(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting null response"""
         # Setup
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
@@ -666,10 +698,9 @@ class TestEdgeCases:
         assert response.status_code in [400, 422]  # 422 for Pydantic validation error
 
     def test_invalid_question_id_format(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Test submitting to invalid question ID"""
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
 
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
@@ -702,22 +733,20 @@ class TestResultsEndpoint:
     """Tests for student results viewing after instructors share."""
 
     @staticmethod
-    def _start_session_with_question(redis_client) -> tuple[RedisClient, str]:
-        redis_wrapper = RedisClient(redis_client)
+    def _start_session_with_question(redis_wrapper: RedisClient) -> str:
         redis_wrapper.start_session("test-course")
-        qid = redis_wrapper.create_question(
+        return redis_wrapper.create_question(
             "test-course",
             QuestionType.MCQ,
             options=["A", "B"],
         )
-        return redis_wrapper, qid
 
     def test_student_can_view_results_after_share(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Students receive counts and their answer after results are shared."""
 
-        redis_wrapper, qid = self._start_session_with_question(redis_client)
+        qid = self._start_session_with_question(redis_wrapper)
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
         other_cookie = create_pid_cookie("A00000000", test_settings.secret_key)
 
@@ -748,11 +777,11 @@ class TestResultsEndpoint:
         assert data["your_answer"] == "A"
 
     def test_results_not_available_until_shared(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Endpoint returns 404 until instructors choose to share."""
 
-        redis_wrapper, qid = self._start_session_with_question(redis_client)
+        qid = self._start_session_with_question(redis_wrapper)
         pid_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
         client.post(
@@ -771,11 +800,11 @@ class TestResultsEndpoint:
         assert response.status_code == 404
 
     def test_results_shows_null_when_student_did_not_answer(
-        self, client: TestClient, test_settings: Settings, redis_client
+        self, client: TestClient, test_settings: Settings, redis_wrapper: RedisClient
     ) -> None:
         """Students who skipped the question see null for their answer."""
 
-        redis_wrapper, qid = self._start_session_with_question(redis_client)
+        qid = self._start_session_with_question(redis_wrapper)
         answering_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
         viewing_cookie = create_pid_cookie("A99999999", test_settings.secret_key)
 
@@ -798,11 +827,10 @@ class TestResultsEndpoint:
         assert data["your_answer"] is None
 
     def test_results_endpoint_requires_auth(
-        self, client: TestClient, redis_client
+        self, client: TestClient, redis_wrapper: RedisClient
     ) -> None:
         """PID authentication is required to view shared results."""
 
-        redis_wrapper = RedisClient(redis_client)
         redis_wrapper.start_session("test-course")
         qid = redis_wrapper.create_question(
             "test-course", QuestionType.MCQ, options=["A", "B"]
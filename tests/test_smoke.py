@@ -38,14 +38,15 @@ def test_redis_connection(redis_client: redis.Redis) -> None:
     assert redis_client.get("test_key") is None
 
 
-def test_courses_toml_loading(test_settings: Settings) -> None:
+def test_courses_toml_loading(test_settings: Settings, course_slug: str) -> None:
     """Test that courses.toml loads correctly"""
     courses = test_settings.load_courses()
 
     # Check that courses were loaded
-    assert len(courses) == 2
+    assert len(courses) == 3
     assert "test-course" in courses
     assert "another-course" in courses
+    assert course_slug in courses
 
     # Check course details
     test_course = courses["test-course"]
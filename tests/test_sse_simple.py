@@ -15,7 +15,10 @@ from app.redis_client import RedisClient
 
 
 @pytest.mark.asyncio
-async def test_sse_stream_format(test_settings: Settings, redis_client) -> None:
+@pytest.mark.requires_real_redis
+async def test_sse_stream_format(
+    test_settings: Settings, redis_wrapper: RedisClient, course_slug: str
+) -> None:
     """
     Test that SSE endpoint formats events correctly
     """
@@ -25,11 +28,10 @@ async def test_sse_stream_format(test_settings: Settings, redis_client) -> None:
     student_cookie = create_pid_cookie("A12345678", test_settings.secret_key)
 
     # Start session
-    redis_wrapper = RedisClient(redis_client)
-    redis_wrapper.start_session("test-course")
+    redis_wrapper.start_session(course_slug)
 
     # Start SSE generator
-    gen = event_generator("test-course", filter_counts=False)
+    gen = event_generator(course_slug, filter_counts=False)
 
     # Get initial connection message
     first_message = await gen.__anext__()
@@ -40,7 +42,7 @@ async def test_sse_stream_format(test_settings: Settings, redis_client) -> None:
     async def publish_event():
         await asyncio.sleep(0.1)
         redis_wrapper.publish_event(
-            "test-course",
+            course_slug,
             EventType.QUESTION_STARTED,
             {
                 "question_id": "q-test-123",
@@ -81,7 +83,10 @@ async def test_sse_stream_format(test_settings: Settings, redis_client) -> None:
 
 
 @pytest.mark.asyncio
-async def test_sse_htmx_compatibility(test_settings: Settings, redis_client) -> None:
+@pytest.mark.requires_real_redis
+async def test_sse_htmx_compatibility(
+    test_settings: Settings, redis_wrapper: RedisClient, course_slug: str
+) -> None:
     """
     Verify SSE output is compatible with HTMX expectations
 
@@ -92,17 +97,16 @@ async def test_sse_htmx_compatibility(test_settings: Settings, redis_client) ->
     """
     from app.routes.sse import event_generator
 
-    redis_wrapper = RedisClient(redis_client)
-    redis_wrapper.start_session("test-course")
+    redis_wrapper.start_session(course_slug)
 
-    gen = event_generator("test-course", filter_counts=False)
+    gen = event_generator(course_slug, filter_counts=False)
 
     # Skip connection message
     await gen.__anext__()
 
     # Publish test event
     redis_wrapper.publish_event(
-        "test-course",
+        course_slug,
         EventType.QUESTION_STARTED,
         {"question_id": "q-123", "type": "mcq", "options": ["A", "B"]},
     )